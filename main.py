@@ -1,10 +1,11 @@
 import pygame
 import sys
 import json
+import logging
 import os
 from src.game_objects import Player, Ghost, Pellet
 from src.map import Map
-from src.utils import Vector2D, Direction, GameState
+from src.utils import Vector2D, Direction, GameState, RenderContext
 from src.sprite_manager import sprite_manager
 from src.sound_manager import sound_manager, SoundType
 
@@ -57,6 +58,9 @@ class Game:
         
         # Configuração da janela
         self._screen = pygame.display.set_mode((self._width, self._height), pygame.RESIZABLE)
+        # Sprites foram carregados antes da janela existir: agora dá para
+        # convertê-los para o formato de pixel da tela
+        sprite_manager.convert_for_display()
         pygame.display.set_caption("Pac-Man OO - Projeto Orientado a Objetos")
         self._clock = pygame.time.Clock()
         self._state = GameState.MENU
@@ -158,6 +162,16 @@ class Game:
             int(height * self._scale_factor)
         )
 
+    def _get_render_context(self, offset_x, offset_y):
+        """Monta os parâmetros de desenho do frame, compartilhados por todas as entidades"""
+        return RenderContext(
+            sprite_manager.base_sprite_size // 2,
+            self._scale_factor,
+            offset_x,
+            offset_y,
+            sprite_manager.sprite_size
+        )
+
     def _initialize_sound_system(self):
         sound_manager.set_volume(SoundType.MUSIC, 0.3)
         sound_manager.set_volume(SoundType.EFFECT, 0.7)
@@ -255,18 +269,26 @@ class Game:
             )
             self._ghosts.append(ghost)
         
-        self._pellets = []
-        pellet_data = self._map.get_pellets()
-        for pellet_info in pellet_data:
-            pellet = Pellet(
-                x=pellet_info["position"].x,
-                y=pellet_info["position"].y,
+        # Pellets indexados pela célula do grid: a colisão com o jogador vira
+        # uma busca O(1) na célula atual em vez de percorrer todos os pellets.
+        # Isso só vale se o raio de colisão (meio sprite) não passar de meia
+        # célula; maior que isso, o pellet de uma célula vizinha também
+        # poderia ser alcançado e Game.update o ignoraria.
+        assert sprite_manager.base_sprite_size // 2 <= self._map.cell_size / 2, \
+            f"Raio de colisão maior que meia célula ({self._map.cell_size}px)"
+        self._pellets = {}
+        pellets = self._map.get_pellet_arrays()
+        kind_names = pellets.KIND_NAMES
+        for x, y, col, row, kind, value in zip(pellets.x, pellets.y, pellets.col,
+                                               pellets.row, pellets.kind, pellets.value):
+            self._pellets[(col, row)] = Pellet(
+                x=x,
+                y=y,
                 color=(255, 255, 255),
                 size=sprite_manager.base_sprite_size,
-                pellet_type=pellet_info["type"],
-                value=pellet_info["value"]
+                pellet_type=kind_names[kind],
+                value=value
             )
-            self._pellets.append(pellet)
         
         self._total_pellets = len(self._pellets)
         self._game_start_time = pygame.time.get_ticks()
@@ -514,30 +536,32 @@ class Game:
         if self._state == GameState.PLAYING:
             self._player.update(delta_time, self._map)
             
+            # position monta um Vector2D novo a cada leitura; lê uma vez por frame
+            player_position = self._player.position
             for ghost in self._ghosts:
-                ghost.update(delta_time, self._player.position, self._player.direction, self._map, self._ghosts)
-            
-            pellets_to_remove = []
-            for pellet in self._pellets:
-                distance = self._player.position.distance_to(pellet.position)
-                collision_radius = sprite_manager.base_sprite_size // 2
-                if distance < collision_radius:
-                    points = pellet.be_eaten()
-                    self._player.eat_pellet(points)
-                    self._map.remove_pellet_at(pellet.position)
-                    
-                    if pellet.type == "power_up":
-                        self._player.activate_power_up()
-                        for ghost in self._ghosts:
-                            ghost.set_vulnerable(8000)
-                        sound_manager.play_sound("ghost-turn-to-blue")
-                    else:
-                        sound_manager.play_sound("eating")
-                    
-                    pellets_to_remove.append(pellet)
-            
-            for pellet in pellets_to_remove:
-                self._pellets.remove(pellet)
+                ghost.update(delta_time, player_position, self._player.direction, self._map, self._ghosts)
+            
+            # O raio de colisão (no máximo meia célula, checado ao montar os
+            # pellets) só alcança o pellet da célula atual
+            cell_size = self._map.cell_size
+            cell = (int(player_position.x // cell_size), int(player_position.y // cell_size))
+            pellet = self._pellets.get(cell)
+            collision_radius = sprite_manager.base_sprite_size // 2
+            collision_radius_sq = collision_radius * collision_radius
+            if pellet is not None and player_position.distance_sq_to(pellet.position) < collision_radius_sq:
+                points = pellet.be_eaten()
+                self._player.eat_pellet(points)
+                self._map.remove_pellet_at(pellet.position)
+                
+                if pellet.type == "power_up":
+                    self._player.activate_power_up()
+                    for ghost in self._ghosts:
+                        ghost.set_vulnerable(8000)
+                    sound_manager.play_sound("ghost-turn-to-blue")
+                else:
+                    sound_manager.play_sound("eating")
+                
+                del self._pellets[cell]
             
             if len(self._pellets) == 0:
                 self._campaign_total_score += self._player.score
@@ -561,9 +585,8 @@ class Game:
                 return
             
             for ghost in self._ghosts:
-                distance = self._player.position.distance_to(ghost.position)
-                collision_radius = sprite_manager.base_sprite_size // 2
-                if distance < collision_radius:
+                # Lido a cada fantasma: uma colisão anterior pode ter resetado o Pac-Man
+                if self._player.position.distance_sq_to(ghost.position) < collision_radius_sq:
                     if ghost.state == "vulnerable":
                         self._player.eat_pellet(200)
                         ghost.set_eaten_with_delay()
@@ -784,22 +807,24 @@ class Game:
         elif self._state == GameState.PLAYING:
             self._map.draw(self._screen, self._scale_factor, offset_x, offset_y)
             
-            for pellet in self._pellets:
-                pellet.draw(self._screen, self._scale_factor, offset_x, offset_y)
+            render_context = self._get_render_context(offset_x, offset_y)
+            for pellet in self._pellets.values():
+                pellet.draw(self._screen, render_context)
             
-            self._player.draw(self._screen, self._scale_factor, offset_x, offset_y)
+            self._player.draw(self._screen, render_context)
             for ghost in self._ghosts:
-                ghost.draw(self._screen, self._scale_factor, offset_x, offset_y)
+                ghost.draw(self._screen, render_context)
             
             self._draw_hud()
             
         elif self._state == GameState.PAUSED:
             self._map.draw(self._screen, self._scale_factor, offset_x, offset_y)
-            for pellet in self._pellets:
-                pellet.draw(self._screen, self._scale_factor, offset_x, offset_y)
-            self._player.draw(self._screen, self._scale_factor, offset_x, offset_y)
+            render_context = self._get_render_context(offset_x, offset_y)
+            for pellet in self._pellets.values():
+                pellet.draw(self._screen, render_context)
+            self._player.draw(self._screen, render_context)
             for ghost in self._ghosts:
-                ghost.draw(self._screen, self._scale_factor, offset_x, offset_y)
+                ghost.draw(self._screen, render_context)
             
             pause_surface = pygame.Surface((self._width, self._height))
             pause_surface.set_alpha(128)
@@ -939,4 +964,11 @@ def main():
         sys.exit()
 
 if __name__ == "__main__":
+    # Por padrão só avisos e erros dos módulos do jogo chegam ao console;
+    # PACMAN_LOG_LEVEL=INFO (ou DEBUG) mostra o carregamento de mapas, sons e sprites.
+    # Valor desconhecido não impede o jogo de abrir: cai para WARNING
+    log_level = os.environ.get("PACMAN_LOG_LEVEL", "WARNING").upper()
+    if not isinstance(logging.getLevelName(log_level), int):
+        log_level = "WARNING"
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
     main() 
\ No newline at end of file
@@ -1,4 +1,5 @@
 import pygame
+import base64
 import json
 import os
 from typing import Dict, Any, List, Tuple
@@ -361,8 +362,13 @@ class MapEditor:
             # Limpar grid
             self.grid = [[EMPTY for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
             
-            # Carregar layout
-            layout = map_data.get("layout", [])
+            # Carregar layout (formato compacto "layout_flat" também é aceito)
+            if "layout_flat" in map_data:
+                cells = base64.b64decode(map_data["layout_flat"])
+                width = map_data["width"]
+                layout = [list(cells[i:i + width]) for i in range(0, len(cells), width)]
+            else:
+                layout = map_data.get("layout", [])
             map_height = len(layout)
             map_width = len(layout[0]) if layout else 0
             
@@ -3,25 +3,43 @@ import pygame
 import math
 import random
 from .utils import Vector2D, Direction, AStar
-from .sprite_manager import sprite_manager
+from .sprite_manager import BASE_SPRITE_SIZE, get_sprite_manager
+
+# Direções cardinais na ordem dos bits da máscara de movimento (bit i = _DIRS_BY_ID[i])
+_DIRS_BY_ID = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+_DIR_BIT = {direction: 1 << i for i, direction in enumerate(_DIRS_BY_ID)}
+
+# Tolerância (ao quadrado) para considerar um waypoint de patrulha alcançado
+_PATROL_TOLERANCE_SQ = {
+    "red": 28 * 28,
+    "pink": 35 * 35,
+    "cyan": 30 * 30,
+    "orange": 40 * 40
+}
+_DEFAULT_PATROL_TOLERANCE_SQ = 32 * 32
 
 class GameObject(ABC):
+    __slots__ = ('_px', '_py', '_color', '_size', '_animation_frame')
+
     def __init__(self, x, y, color, size):
-        self._position = Vector2D(x, y)
+        # Coordenadas guardadas como floats simples; o Vector2D só é criado
+        # quando código externo lê a propriedade position
+        self._px = x
+        self._py = y
         self._color = color
         self._size = size
         self._animation_frame = 0
 
     @property
     def position(self):
-        return self._position
+        return Vector2D(self._px, self._py)
 
     @position.setter
     def position(self, new_position):
+        # Vector2D também é tupla: um só caminho atende os dois
         if isinstance(new_position, tuple):
-            self._position = Vector2D(new_position[0], new_position[1])
-        elif isinstance(new_position, Vector2D):
-            self._position = new_position
+            self._px = new_position[0]
+            self._py = new_position[1]
         else:
             raise TypeError("A posição deve ser uma tupla ou um Vector2D")
 
@@ -34,7 +52,7 @@ class GameObject(ABC):
         return self._size
 
     @abstractmethod
-    def draw(self, screen):
+    def draw(self, screen, render_context):
         pass
 
     @abstractmethod
@@ -42,15 +60,17 @@ class GameObject(ABC):
         pass
 
     def get_rect(self):
-        sprite_size = sprite_manager.base_sprite_size
+        sprite_size = BASE_SPRITE_SIZE
         return pygame.Rect(
-            self._position.x - sprite_size // 2,
-            self._position.y - sprite_size // 2,
+            self._px - sprite_size // 2,
+            self._py - sprite_size // 2,
             sprite_size,
             sprite_size
         )
 
 class MovableObject(GameObject):
+    __slots__ = ('_speed', '_direction', '_next_direction')
+
     def __init__(self, x, y, color, size, speed, direction=Direction.NONE):
         super().__init__(x, y, color, size)
         self._speed = speed
@@ -71,14 +91,15 @@ class MovableObject(GameObject):
 
     @direction.setter
     def direction(self, new_direction):
+        # Setter reservado a chamadas externas (entrada do jogador); o código
+        # interno de movimento e IA grava self._direction diretamente
         if isinstance(new_direction, Direction):
             self._next_direction = new_direction
         elif isinstance(new_direction, tuple) and len(new_direction) == 2:
-            for d in Direction:
-                if d.value == new_direction:
-                    self._next_direction = d
-                    return
-            raise ValueError(f"Tupla de direção inválida: {new_direction}")
+            try:
+                self._next_direction = Direction(new_direction)
+            except ValueError:
+                raise ValueError(f"Tupla de direção inválida: {new_direction}") from None
         else:
             raise TypeError("A direção deve ser um enum Direction ou uma tupla (x, y)")
 
@@ -86,27 +107,25 @@ class MovableObject(GameObject):
         if direction == Direction.NONE:
             return False
         
-        next_pos = Vector2D(
-            self._position.x + direction.value[0] * self._speed,
-            self._position.y + direction.value[1] * self._speed
-        )
+        next_x = self._px + direction.value[0] * self._speed
+        next_y = self._py + direction.value[1] * self._speed
         
         if entity_type is None:
             entity_type = "default"
         
-        return game_map.is_valid_position(next_pos, sprite_manager.base_sprite_size, entity_type)
+        return game_map.is_valid_xy(next_x, next_y, BASE_SPRITE_SIZE, entity_type)
 
     def move(self, direction=None):
         if direction is None:
             direction = self._direction
         
         if direction != Direction.NONE:
-            self._position += Vector2D(
-                direction.value[0] * self._speed,
-                direction.value[1] * self._speed
-            )
+            self._px += direction.value[0] * self._speed
+            self._py += direction.value[1] * self._speed
 
 class Player(MovableObject):
+    __slots__ = ('_lives', '_score', '_power_up_active', '_power_up_timer', '_power_up_duration')
+
     def __init__(self, x, y, color, size, speed, lives, score=0):
         super().__init__(x, y, color, size, speed)
         self._lives = lives
@@ -148,20 +167,20 @@ class Player(MovableObject):
         if self._lives < 0:
             self._lives = 0
 
-    def draw(self, screen, scale_factor=1.0, offset_x=0, offset_y=0):
-        sprite = sprite_manager.get_pacman_sprite(self._direction, self._animation_frame)
+    def draw(self, screen, render_context):
+        sprite = get_sprite_manager().get_pacman_sprite(self._direction, self._animation_frame)
         
-        sprite_size = sprite_manager.sprite_size
-        x = int((self._position.x - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_x
-        y = int((self._position.y - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_y
+        ctx = render_context
+        x = int((self._px - ctx.half_sprite) * ctx.scale) + ctx.offset_x
+        y = int((self._py - ctx.half_sprite) * ctx.scale) + ctx.offset_y
         
         if self._power_up_active:
-            glow_size = sprite_size + int(4 * scale_factor)
+            glow_size = ctx.sprite_size + int(4 * ctx.scale)
             glow_surface = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
             glow_color = (255, 255, 100, 100) if (self._animation_frame // 5) % 2 else (255, 255, 0, 150)
-            glow_radius = sprite_size//2 + int(2 * scale_factor)
+            glow_radius = ctx.sprite_size//2 + int(2 * ctx.scale)
             pygame.draw.circle(glow_surface, glow_color, (glow_size//2, glow_size//2), glow_radius)
-            screen.blit(glow_surface, (x - int(2 * scale_factor), y - int(2 * scale_factor)))
+            screen.blit(glow_surface, (x - int(2 * ctx.scale), y - int(2 * ctx.scale)))
         
         screen.blit(sprite, (x, y))
 
@@ -191,11 +210,24 @@ class Player(MovableObject):
         self._animation_frame += 1
 
 class Ghost(MovableObject):
+    __slots__ = (
+        '_state', '_initial_position', '_ghost_type', '_vulnerable_timer', '_target_position',
+        '_mode_timer', '_current_mode', '_path_finding_timer', '_original_color',
+        '_last_direction', '_personality_timer',
+        # A* pathfinding
+        '_current_path', '_path_index', '_recalculate_path_timer', '_use_astar',
+        '_astar_frequency', '_last_target', '_smooth_movement',
+        # Patrulhamento
+        '_patrol_route', '_patrol_index', '_patrol_timer',
+        # Dificuldade e delay no spawn
+        '_base_speed', '_difficulty_multiplier',
+        '_is_in_spawn_delay', '_spawn_delay_timer', '_spawn_delay_duration'
+    )
+
     def __init__(self, x, y, color, size, speed, initial_position, ghost_type="red"):
         super().__init__(x, y, color, size, speed)
         self._state = "normal"
-        self._initial_position = Vector2D(initial_position.x if isinstance(initial_position, Vector2D) else initial_position[0],
-                                        initial_position.y if isinstance(initial_position, Vector2D) else initial_position[1])
+        self._initial_position = Vector2D(initial_position[0], initial_position[1])
         self._ghost_type = ghost_type
         self._vulnerable_timer = 0
         self._target_position = Vector2D(0, 0)
@@ -325,16 +357,13 @@ class Ghost(MovableObject):
             return False
         
         current_target = self.get_current_patrol_target()
-        distance = self._position.distance_to(current_target)
         
-        tolerance = {
-            "red": 28,
-            "pink": 35,
-            "cyan": 30,
-            "orange": 40
-        }.get(self._ghost_type, 32)
+        # Compara distâncias ao quadrado para evitar o sqrt
+        dx = self._px - current_target.x
+        dy = self._py - current_target.y
+        tolerance_sq = _PATROL_TOLERANCE_SQ.get(self._ghost_type, _DEFAULT_PATROL_TOLERANCE_SQ)
         
-        if distance < tolerance:
+        if dx * dx + dy * dy < tolerance_sq:
             self._patrol_index = (self._patrol_index + 1) % len(self._patrol_route)
             return True
         
@@ -366,7 +395,7 @@ class Ghost(MovableObject):
             "current_waypoint": self._patrol_index,
             "target_position": self.get_current_patrol_target(),
             "ghost_type": self._ghost_type,
-            "distance_to_target": self._position.distance_to(self.get_current_patrol_target()) if self._patrol_route else 0
+            "distance_to_target": self.position.distance_to(self.get_current_patrol_target()) if self._patrol_route else 0
         }
 
     @property
@@ -432,16 +461,17 @@ class Ghost(MovableObject):
                             player_ahead = player_position.copy()
                         
                         mid_point = Vector2D(
-                            (player_ahead.x + red_ghost.position.x) / 2,
-                            (player_ahead.y + red_ghost.position.y) / 2
+                            (player_ahead.x + red_ghost._px) / 2,
+                            (player_ahead.y + red_ghost._py) / 2
                         )
                         return mid_point
                 return player_position.copy()
                 
             else:  # orange (Clyde)
                 # Alterna entre perseguir e fugir
-                distance = self._position.distance_to(player_position)
-                if distance > 80:
+                dx = self._px - player_position.x
+                dy = self._py - player_position.y
+                if dx * dx + dy * dy > 80 * 80:
                     return player_position.copy()
                 else:
                     return Vector2D(50, 450)
@@ -450,15 +480,15 @@ class Ghost(MovableObject):
 
     def choose_direction(self, game_map, target_position):
         possible_directions = []
+        target_x = target_position.x
+        target_y = target_position.y
         
         for direction in [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]:
             if self.can_move(direction, game_map):
-                test_pos = Vector2D(
-                    self._position.x + direction.value[0] * self._speed,
-                    self._position.y + direction.value[1] * self._speed
-                )
-                distance = test_pos.distance_to(target_position)
-                possible_directions.append((direction, distance))
+                dx = self._px + direction.value[0] * self._speed - target_x
+                dy = self._py + direction.value[1] * self._speed - target_y
+                # Só a ordem importa (min/max), então o quadrado basta
+                possible_directions.append((direction, dx * dx + dy * dy))
         
         if not possible_directions:
             return Direction.NONE
@@ -468,17 +498,27 @@ class Ghost(MovableObject):
         else:
             return min(possible_directions, key=lambda x: x[1])[0]
 
-    def choose_direction_advanced(self, game_map, target_position):
+    def get_valid_directions_mask(self, game_map):
+        """Retorna máscara de 4 bits com as direções livres a partir da posição atual"""
+        valid_mask = 0
+        for i, direction in enumerate(_DIRS_BY_ID):
+            if self.can_move(direction, game_map):
+                valid_mask |= 1 << i
+        return valid_mask
+
+    def choose_direction_advanced(self, game_map, target_position, valid_mask=None):
         """Escolhe direção com lógica avançada e orgânica"""
+        if valid_mask is None:
+            valid_mask = self.get_valid_directions_mask(game_map)
+        
         possible_directions = []
+        target_x = target_position.x
+        target_y = target_position.y
         
-        for direction in [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]:
-            if self.can_move(direction, game_map):
-                test_pos = Vector2D(
-                    self._position.x + direction.value[0] * self._speed,
-                    self._position.y + direction.value[1] * self._speed
-                )
-                distance = test_pos.manhattan_distance_to(target_position)
+        for i, direction in enumerate(_DIRS_BY_ID):
+            if valid_mask & (1 << i):
+                distance = (abs(self._px + direction.value[0] * self._speed - target_x) +
+                            abs(self._py + direction.value[1] * self._speed - target_y))
                 possible_directions.append((direction, distance))
         
         if not possible_directions:
@@ -548,7 +588,8 @@ class Ghost(MovableObject):
                 self._mode_timer = 0
 
     def reset_position(self):
-        self._position = self._initial_position.copy()
+        self._px = self._initial_position.x
+        self._py = self._initial_position.y
         self._state = "normal"
         self._speed = self._base_speed
         self._vulnerable_timer = 0
@@ -565,7 +606,8 @@ class Ghost(MovableObject):
 
     def set_eaten_with_delay(self):
         """Coloca fantasma no spawn com delay de 5 segundos"""
-        self._position = self._initial_position.copy()
+        self._px = self._initial_position.x
+        self._py = self._initial_position.y
         self._state = "normal"
         self._speed = self._base_speed
         self._vulnerable_timer = 0
@@ -588,8 +630,8 @@ class Ghost(MovableObject):
         self._astar_frequency = 2000
 
     def calculate_direction_to_waypoint(self, waypoint):
-        diff_x = waypoint.x - self._position.x
-        diff_y = waypoint.y - self._position.y
+        diff_x = waypoint.x - self._px
+        diff_y = waypoint.y - self._py
         
         if abs(diff_x) > abs(diff_y):
             if diff_x > 0:
@@ -616,29 +658,34 @@ class Ghost(MovableObject):
             base_chance = 0.85
             return random.random() < min(base_chance + difficulty_bonus, 1.0)
         else:  # orange
-            distance = self._position.distance_to(target_position)
-            if distance > 150:
+            dx = self._px - target_position.x
+            dy = self._py - target_position.y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq > 150 * 150:
                 base_chance = 0.8
                 return random.random() < min(base_chance + difficulty_bonus, 1.0)
-            elif distance > 80:
+            elif distance_sq > 80 * 80:
                 base_chance = 0.5
                 return random.random() < min(base_chance + difficulty_bonus, 0.95)
             else:
                 base_chance = 0.2
                 return random.random() < min(base_chance + difficulty_bonus, 0.8)
 
-    def astar_pathfinding(self, game_map, target_position):
+    def astar_pathfinding(self, game_map, target_position, valid_mask=None):
         """Usa A* para encontrar caminho até o alvo"""
+        if valid_mask is None:
+            valid_mask = self.get_valid_directions_mask(game_map)
+        
         should_recalculate = (
             len(self._current_path) == 0 or
             self._path_index >= len(self._current_path) - 1 or
             self._recalculate_path_timer > self._astar_frequency or
-            (self._last_target and self._last_target.distance_to(target_position) > 32)
+            (self._last_target and self._last_target.distance_sq_to(target_position) > 32 * 32)
         )
         
         if should_recalculate:
             self._current_path = AStar.find_path(
-                self._position, 
+                self.position, 
                 target_position, 
                 game_map, 
                 "manhattan"
@@ -650,7 +697,9 @@ class Ghost(MovableObject):
         if self._current_path and self._path_index < len(self._current_path) - 1:
             next_waypoint = self._current_path[self._path_index + 1]
             
-            if self._position.distance_to(next_waypoint) < 12:
+            dx = next_waypoint.x - self._px
+            dy = next_waypoint.y - self._py
+            if dx * dx + dy * dy < 12 * 12:
                 self._path_index += 1
                 if self._path_index < len(self._current_path) - 1:
                     next_waypoint = self._current_path[self._path_index + 1]
@@ -659,27 +708,27 @@ class Ghost(MovableObject):
             
             direction = self.calculate_direction_to_waypoint(next_waypoint)
             
-            if self.can_move(direction, game_map):
+            if valid_mask & _DIR_BIT[direction]:
                 return direction
         
-        return self.choose_direction_advanced(game_map, target_position)
+        return self.choose_direction_advanced(game_map, target_position, valid_mask)
 
-    def draw(self, screen, scale_factor=1.0, offset_x=0, offset_y=0):
-        sprite = sprite_manager.get_ghost_sprite(
+    def draw(self, screen, render_context):
+        sprite = get_sprite_manager().get_ghost_sprite(
             self._ghost_type, 
             self._direction, 
             self._animation_frame, 
             self._state
         )
         
-        sprite_size = sprite_manager.sprite_size
-        x = int((self._position.x - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_x
-        y = int((self._position.y - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_y
+        ctx = render_context
+        x = int((self._px - ctx.half_sprite) * ctx.scale) + ctx.offset_x
+        y = int((self._py - ctx.half_sprite) * ctx.scale) + ctx.offset_y
         
         screen.blit(sprite, (x, y))
         
         if self._is_in_spawn_delay:
-            overlay = pygame.Surface((sprite_size, sprite_size), pygame.SRCALPHA)
+            overlay = pygame.Surface((ctx.sprite_size, ctx.sprite_size), pygame.SRCALPHA)
             alpha = 80 + int(40 * abs(math.sin(pygame.time.get_ticks() * 0.01)))
             overlay.fill((255, 255, 255, alpha))
             screen.blit(overlay, (x, y))
@@ -719,6 +768,9 @@ class Ghost(MovableObject):
             use_astar = self._use_astar and self.should_use_astar(target)
             
             new_direction = Direction.NONE
+            # A posição não muda até o move(), então as direções livres são
+            # calculadas uma única vez por tick e reaproveitadas nas decisões
+            valid_mask = None
             
             if use_astar:
                 astar_interval = {
@@ -729,7 +781,8 @@ class Ghost(MovableObject):
                 }.get(self._ghost_type, 500)
                 
                 if self._recalculate_path_timer > astar_interval:
-                    new_direction = self.astar_pathfinding(game_map, target)
+                    valid_mask = self.get_valid_directions_mask(game_map)
+                    new_direction = self.astar_pathfinding(game_map, target, valid_mask)
                     if new_direction != Direction.NONE:
                         self._direction = new_direction
                         self._last_direction = new_direction
@@ -743,20 +796,26 @@ class Ghost(MovableObject):
                 }.get(self._ghost_type, 350)
                 
                 if self._path_finding_timer > legacy_interval:
-                    new_direction = self.choose_direction_advanced(game_map, target)
+                    valid_mask = self.get_valid_directions_mask(game_map)
+                    new_direction = self.choose_direction_advanced(game_map, target, valid_mask)
                     if new_direction != Direction.NONE:
                         self._direction = new_direction
                         self._last_direction = new_direction
                     self._path_finding_timer = 0
 
-            if self.can_move(self._direction, game_map):
+            if valid_mask is None:
+                can_continue = self.can_move(self._direction, game_map)
+            else:
+                can_continue = valid_mask & _DIR_BIT.get(self._direction, 0)
+            
+            if can_continue:
                 self.move()
             else:
                 if use_astar:
                     self._current_path = []
-                    self._direction = self.astar_pathfinding(game_map, target)
+                    self._direction = self.astar_pathfinding(game_map, target, valid_mask)
                 else:
-                    self._direction = self.choose_direction_advanced(game_map, target)
+                    self._direction = self.choose_direction_advanced(game_map, target, valid_mask)
                 
                 if self._direction != Direction.NONE:
                     self._last_direction = self._direction
@@ -764,6 +823,8 @@ class Ghost(MovableObject):
         self._animation_frame += 1
 
 class Pellet(GameObject):
+    __slots__ = ('_type', '_value')
+
     def __init__(self, x, y, color, size, pellet_type="normal", value=10):
         super().__init__(x, y, color, size)
         self._type = pellet_type
@@ -780,12 +841,12 @@ class Pellet(GameObject):
     def be_eaten(self):
         return self._value
 
-    def draw(self, screen, scale_factor=1.0, offset_x=0, offset_y=0):
-        sprite = sprite_manager.get_pellet_sprite(self._type, self._animation_frame)
+    def draw(self, screen, render_context):
+        sprite = get_sprite_manager().get_pellet_sprite(self._type, self._animation_frame)
         
-        sprite_size = sprite_manager.sprite_size
-        x = int((self._position.x - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_x
-        y = int((self._position.y - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_y
+        ctx = render_context
+        x = int((self._px - ctx.half_sprite) * ctx.scale) + ctx.offset_x
+        y = int((self._py - ctx.half_sprite) * ctx.scale) + ctx.offset_y
         
         screen.blit(sprite, (x, y))
 
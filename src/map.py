@@ -1,9 +1,172 @@
 import pygame
+import base64
 import json
+import logging
+import mmap
 import os
-import glob
+import re
+from array import array
+from types import MappingProxyType
 from .utils import Vector2D
-from .sprite_manager import sprite_manager
+from .sprite_manager import BASE_SPRITE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Abaixo disso o custo de criar o mapeamento supera a cópia do f.read()
+_MMAP_MIN_BYTES = 64 * 1024
+
+try:
+    import orjson  # Parser JSON em C, bem mais rápido que o json da stdlib
+except ImportError:
+    orjson = None
+
+
+def _read_json_file(file_path):
+    """
+    Lê e decodifica um arquivo JSON, usando orjson quando disponível.
+    
+    O arquivo é lido em bytes: ambos os parsers tratam o UTF-8 diretamente.
+    Arquivos grandes são mapeados em memória e o orjson lê direto do mapeamento,
+    sem a cópia intermediária do f.read(). Erros de sintaxe levantam
+    json.JSONDecodeError (orjson.JSONDecodeError é subclasse dela).
+    """
+    with open(file_path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+# Prefixo lido do arquivo para achar o bloco de metadados sem parsear o layout
+_METADATA_PREFIX_BYTES = 4096
+_METADATA_KEY = re.compile(r'\A\s*\{\s*"metadata"\s*:\s*')
+
+
+def _read_map_metadata(file_path):
+    """
+    Lê só o objeto "metadata" de um arquivo de mapa.
+    
+    Quando "metadata" é a primeira chave do arquivo (caso de todos os mapas
+    do jogo), decodifica apenas esse objeto a partir do início do arquivo,
+    sem montar a grade do layout. Em qualquer outro formato cai no parse
+    completo.
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(_METADATA_PREFIX_BYTES)
+    
+    try:
+        text = head.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # Só um caractere multibyte cortado no fim do prefixo é descartado;
+        # bytes inválidos no meio do arquivo ficam a cargo do parse completo
+        if e.reason != 'unexpected end of data' or len(head) < _METADATA_PREFIX_BYTES:
+            return _read_json_file(file_path).get('metadata', {})
+        text = head[:e.start].decode('utf-8')
+    match = _METADATA_KEY.match(text)
+    if match:
+        try:
+            metadata, _ = _JSON_DECODER.raw_decode(text, match.end())
+            if isinstance(metadata, dict):
+                return metadata
+        except json.JSONDecodeError:
+            pass  # Metadados maiores que o prefixo ou formato inesperado
+    
+    return _read_json_file(file_path).get('metadata', {})
+
+
+# Metadados da listagem de mapas: {caminho: (mtime, info)}
+# Evita reabrir e reparsear todos os JSON a cada visita ao menu
+_MAP_LIST_CACHE = {}
+
+# Células aceitas no layout (0=caminho, 1=parede, 2=pellet, 3=power-up).
+# bool é subclasse de int e já era aceito pela validação original.
+_VALID_CELL_BYTES = bytes((0, 1, 2, 3))
+
+# Células (coluna, linha) de spawn usadas quando o mapa não define as suas
+_DEFAULT_SPAWN_CELLS = {
+    "player": (1, 1),
+    "ghost_red": (17, 9),
+    "ghost_pink": (18, 9),
+    "ghost_cyan": (17, 10),
+    "ghost_orange": (18, 10),
+}
+
+# Define diferentes margens para diferentes tipos de entidades
+# Margens menores = controle mais preciso, mas mais difícil passar por espaços apertados
+# Margens maiores = controle mais fluido, mas pode causar colisões aparentemente incorretas
+_COLLISION_DIVISORS = {
+    # Player tem margem mais apertada para movimento mais preciso e controle responsivo
+    # Permite ao jogador navegar por corredores estreitos com mais facilidade
+    "player": 2.125,
+    # Fantasmas têm margem ligeiramente mais generosa para movimento mais fluido
+    # Evita que os fantasmas fiquem "presos" em situações de pathfinding
+    "ghost": 3,
+}
+# Default para outros objetos (pellets, itens especiais, etc.)
+_DEFAULT_COLLISION_DIVISOR = 3
+
+# Tipo e pontuação de cada célula com pellet (2=pellet, 3=power-up)
+_PELLET_KINDS = {2: ("normal", 10), 3: ("power_up", 50)}
+_PELLET_CELL = re.compile(b"[\x02\x03]")
+
+# bytes.translate: parede (1) vira o dígito '1', qualquer outra célula '0'
+_WALL_BIT_TABLE = bytes(0x31 if value == 1 else 0x30 for value in range(256))
+
+
+class PelletArrays:
+    """
+    Pellets do mapa em estrutura de arrays: o pellet i tem centro (x[i], y[i]),
+    fica na célula (col[i], row[i]) e tem tipo kind[i] (2 ou 3) e pontos value[i].
+    
+    Evita um dict e um Vector2D por pellet quando só os números são necessários.
+    """
+    __slots__ = ('x', 'y', 'col', 'row', 'kind', 'value')
+
+    # kind -> nome do tipo ("normal"/"power_up"), tirado da mesma tabela do mapa
+    KIND_NAMES = {kind: name for kind, (name, _) in _PELLET_KINDS.items()}
+
+    def __init__(self, x, y, col, row, kind, value):
+        self.x = x
+        self.y = y
+        self.col = col
+        self.row = row
+        self.kind = kind
+        self.value = value
+
+    def __len__(self):
+        return len(self.kind)
+
+
+def convert_map_to_flat(file_path, output_path=None):
+    """
+    Converte um arquivo de mapa do formato "layout" (lista de linhas) para o
+    formato compacto "layout_flat" (base64 de um byte por célula + width/height).
+    
+    Uso único para migrar mapas existentes, por exemplo:
+        python -c "from src.map import convert_map_to_flat; convert_map_to_flat('assets/maps/x.json')"
+    
+    Args:
+        file_path: Arquivo de mapa no formato antigo
+        output_path: Destino (por padrão sobrescreve file_path)
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        map_data = json.load(f)
+    
+    layout = map_data.pop('layout')
+    map_data['width'] = len(layout[0]) if layout else 0
+    map_data['height'] = len(layout)
+    map_data['layout_flat'] = base64.b64encode(b"".join(bytes(row) for row in layout)).decode('ascii')
+    
+    with open(output_path or file_path, 'w', encoding='utf-8') as f:
+        json.dump(map_data, f, indent=2, ensure_ascii=False)
+
 
 class Map:
     def __init__(self, layout_data=None, cell_size=None, map_file_path=None):
@@ -16,11 +179,18 @@ class Map:
             map_file_path: Caminho para arquivo JSON do mapa (opcional)
         """
         self._layout = []
-        self._cell_size = cell_size if cell_size else sprite_manager.base_sprite_size
+        self._grid = bytearray()  # Layout linearizado (linha a linha), um byte por célula
+        self._wall_rows = []  # Bitmap de paredes, um inteiro por linha
+        self._pellets_cache = None  # {índice no grid: pellet}, montado sob demanda
+        self._draw_cache = {}  # {scale_factor: Surface com o labirinto já desenhado}
+        self._pellet_count = 0  # Pellets restantes, atualizado em remove_pellet_at
+        self._layout_version = 0  # Incrementado a cada layout novo, ver layout_version
+        self._cell_size = cell_size if cell_size else BASE_SPRITE_SIZE
         self._width = 0
         self._height = 0
         self._metadata = {}
-        self._spawn_positions = {}
+        self._spawn_positions = MappingProxyType({})
+        self._fallback_spawn = Vector2D(self._cell_size, self._cell_size)
         self._original_map_path = None
         
         # Se dados manuais fornecidos, usa eles (compatibilidade)
@@ -32,7 +202,7 @@ class Map:
             # Sempre tenta carregar de JSON primeiro
             map_path = map_file_path or "assets/maps/default_map.json"
             if not self.load_from_json(map_path):
-                print(f"Aviso: Falha ao carregar mapa JSON. Usando mapa padrão.")
+                logger.warning("Falha ao carregar mapa JSON. Usando mapa padrão.")
                 self.load_default_map()
 
     def load_from_json(self, file_path):
@@ -48,21 +218,28 @@ class Map:
         try:
             # Verifica se arquivo existe
             if not os.path.exists(file_path):
-                print(f"Erro: Arquivo de mapa não encontrado: {file_path}")
+                logger.error("Arquivo de mapa não encontrado: %s", file_path)
                 return False
             
             # Carrega e valida JSON
-            with open(file_path, 'r', encoding='utf-8') as f:
-                map_data = json.load(f)
+            map_data = _read_json_file(file_path)
             
-            # Valida estrutura básica do JSON
-            if not self._validate_map_json(map_data):
-                print(f"Erro: Estrutura inválida no arquivo de mapa: {file_path}")
+            # Valida estrutura básica do JSON; a grade já convertida volta como
+            # valor (nada fica no objeto se a carga falhar no meio)
+            grid = self._validate_map_json(map_data)
+            if grid is None:
+                logger.error("Estrutura inválida no arquivo de mapa: %s", file_path)
                 return False
             
             # Extrai dados do JSON
             self._metadata = map_data.get('metadata', {})
-            self._layout = map_data['layout']
+            if 'layout_flat' in map_data:
+                # Linhas montadas direto dos bytes já validados, sem passar por
+                # uma lista JSON de inteiros
+                cells, width = grid, map_data['width']
+                self._layout = [list(cells[i:i + width]) for i in range(0, len(cells), width)]
+            else:
+                self._layout = map_data['layout']
             
             # Atualiza cell_size se especificado no JSON
             if 'cell_size' in self._metadata:
@@ -73,25 +250,25 @@ class Map:
             self._load_spawn_positions(spawn_data)
             
             # Atualiza dimensões
-            self._update_dimensions()
+            self._update_dimensions(grid)
             
             # Valida dimensões
             if not self._validate_dimensions():
-                print(f"Erro: Dimensões inválidas no mapa")
+                logger.error("Dimensões inválidas no mapa")
                 return False
             
             # Salva o caminho original para reset
             self._original_map_path = file_path
             
-            print(f"Mapa carregado com sucesso: {self._metadata.get('name', 'Sem nome')}")
-            print(f"Dimensões: {self._width}x{self._height}, Cell Size: {self._cell_size}")
+            logger.info("Mapa carregado com sucesso: %s", self._metadata.get('name', 'Sem nome'))
+            logger.debug("Dimensões: %dx%d, Cell Size: %s", self._width, self._height, self._cell_size)
             return True
             
         except json.JSONDecodeError as e:
-            print(f"Erro ao decodificar JSON: {e}")
+            logger.error("Erro ao decodificar JSON: %s", e)
             return False
         except Exception as e:
-            print(f"Erro inesperado ao carregar mapa: {e}")
+            logger.error("Erro inesperado ao carregar mapa: %s", e)
             return False
 
     def _validate_map_json(self, map_data):
@@ -102,38 +279,88 @@ class Map:
             map_data: Dados do mapa carregados do JSON
             
         Returns:
-            bool: True se válido, False caso contrário
+            bytes | None: Grade convertida (linha a linha, um byte por célula),
+                reaproveitada por _update_dimensions, ou None se inválido
         """
+        # Formato compacto: grade inteira numa única string base64
+        if 'layout_flat' in map_data:
+            return self._validate_flat_layout(map_data)
+        
         # Verifica campos obrigatórios
         required_fields = ['layout']
         for field in required_fields:
             if field not in map_data:
-                print(f"Campo obrigatório ausente: {field}")
-                return False
+                logger.warning("Campo obrigatório ausente: %s", field)
+                return None
         
         # Valida layout
         layout = map_data['layout']
         if not isinstance(layout, list) or len(layout) == 0:
-            print("Layout deve ser uma lista não-vazia")
-            return False
+            logger.warning("Layout deve ser uma lista não-vazia")
+            return None
         
         # Verifica se todas as linhas têm o mesmo tamanho
         row_length = len(layout[0])
+        row_bytes = []
         for i, row in enumerate(layout):
             if not isinstance(row, list):
-                print(f"Linha {i} deve ser uma lista")
-                return False
+                logger.warning("Linha %d deve ser uma lista", i)
+                return None
             if len(row) != row_length:
-                print(f"Linha {i} tem tamanho inconsistente")
-                return False
+                logger.warning("Linha %d tem tamanho inconsistente", i)
+                return None
             
-            # Valida valores das células
-            for j, cell in enumerate(row):
-                if not isinstance(cell, int) or cell < 0 or cell > 3:
-                    print(f"Valor inválido na posição ({i}, {j}): {cell}")
-                    return False
+            # Valida valores das células: bytes() converte a linha inteira em C
+            # e falha com qualquer coisa que não seja int em 0..255; o que sobra
+            # após remover 0-3 são valores fora do intervalo. A célula culpada
+            # só é procurada quando algo falha.
+            try:
+                cells = bytes(row)
+            except (TypeError, ValueError):
+                cells = None
+            if cells is None or cells.translate(None, _VALID_CELL_BYTES):
+                for j, cell in enumerate(row):
+                    if not isinstance(cell, int) or cell < 0 or cell > 3:
+                        logger.warning("Valor inválido na posição (%d, %d): %r", i, j, cell)
+                        return None
+            row_bytes.append(cells)
         
-        return True
+        # Grade já convertida, reaproveitada por _update_dimensions
+        return b"".join(row_bytes)
+
+    def _validate_flat_layout(self, map_data):
+        """
+        Valida um layout no formato compacto {"layout_flat", "width", "height"}.
+        
+        Args:
+            map_data: Dados do mapa carregados do JSON
+            
+        Returns:
+            bytes | None: Grade decodificada, um byte por célula, ou None se inválido
+        """
+        width = map_data.get('width')
+        height = map_data.get('height')
+        if not isinstance(width, int) or not isinstance(height, int) or width <= 0 or height <= 0:
+            logger.warning("layout_flat exige width e height inteiros positivos")
+            return None
+        
+        try:
+            cells = base64.b64decode(map_data['layout_flat'], validate=True)
+        except (TypeError, ValueError) as e:
+            logger.warning("layout_flat não é base64 válido: %s", e)
+            return None
+        
+        if len(cells) != width * height:
+            logger.warning("layout_flat tem %d células, esperado %dx%d", len(cells), width, height)
+            return None
+        
+        if cells.translate(None, _VALID_CELL_BYTES):
+            index = next(i for i, cell in enumerate(cells) if cell > 3)
+            row, col = divmod(index, width)
+            logger.warning("Valor inválido na posição (%d, %d): %r", row, col, cells[index])
+            return None
+        
+        return cells
 
     def _load_spawn_positions(self, spawn_data):
         """
@@ -142,33 +369,76 @@ class Map:
         Args:
             spawn_data: Dados de spawn do JSON
         """
-        self._spawn_positions = {}
+        cell_size = self._cell_size
+        h = cell_size // 2
+        spawn_positions = {}
         
         for entity_type, pos_data in spawn_data.items():
             if isinstance(pos_data, dict) and 'x' in pos_data and 'y' in pos_data:
                 # Converte coordenadas de grid para coordenadas do mundo
-                x = pos_data['x'] * self._cell_size + self._cell_size // 2
-                y = pos_data['y'] * self._cell_size + self._cell_size // 2
-                self._spawn_positions[entity_type] = Vector2D(x, y)
+                x = pos_data['x'] * cell_size + h
+                y = pos_data['y'] * cell_size + h
+                spawn_positions[entity_type] = Vector2D(x, y)
         
         # Se não há posições de spawn definidas, usa padrões
-        if not self._spawn_positions:
+        if not spawn_positions:
             self._set_default_spawn_positions()
+            return
+        
+        # Somente leitura: as posições são compartilhadas entre os resets
+        self._spawn_positions = MappingProxyType(spawn_positions)
+        self._fallback_spawn = Vector2D(cell_size, cell_size)
 
     def _set_default_spawn_positions(self):
         """Define posições de spawn padrão."""
-        self._spawn_positions = {
-            "player": Vector2D(1 * self._cell_size + self._cell_size // 2, 1 * self._cell_size + self._cell_size // 2),
-            "ghost_red": Vector2D(17 * self._cell_size + self._cell_size // 2, 9 * self._cell_size + self._cell_size // 2),
-            "ghost_pink": Vector2D(18 * self._cell_size + self._cell_size // 2, 9 * self._cell_size + self._cell_size // 2),
-            "ghost_cyan": Vector2D(17 * self._cell_size + self._cell_size // 2, 10 * self._cell_size + self._cell_size // 2),
-            "ghost_orange": Vector2D(18 * self._cell_size + self._cell_size // 2, 10 * self._cell_size + self._cell_size // 2)
-        }
+        cell_size = self._cell_size
+        h = cell_size // 2
+        self._spawn_positions = MappingProxyType({
+            entity_type: Vector2D(col * cell_size + h, row * cell_size + h)
+            for entity_type, (col, row) in _DEFAULT_SPAWN_CELLS.items()
+        })
+        self._fallback_spawn = Vector2D(cell_size, cell_size)
 
-    def _update_dimensions(self):
-        """Atualiza as dimensões do mapa baseado no layout."""
+    def _update_dimensions(self, grid=None):
+        """
+        Atualiza as dimensões do mapa baseado no layout.
+        
+        Args:
+            grid: Grade já convertida por _validate_map_json (opcional); sem
+                ela, ou se o tamanho não bater, a grade é montada do layout
+        """
         self._height = len(self._layout)
         self._width = len(self._layout[0]) if self._layout else 0
+        
+        # Cópia contígua do layout: célula (row, col) fica em row * width + col.
+        # As consultas do jogo leem daqui; _layout continua sendo a forma
+        # exposta pela propriedade layout e é mantido em sincronia.
+        # Linhas com tamanho diferente são ajustadas à largura (faltantes = parede)
+        # para não desalinhar as linhas seguintes.
+        width = self._width
+        if grid is not None and len(grid) == width * self._height:
+            self._grid = bytearray(grid)
+        else:
+            self._grid = bytearray(b"".join(bytes(row)[:width].ljust(width, b"\x01") for row in self._layout))
+        
+        # Bitmap de paredes por linha: o bit c de _wall_rows[r] vale 1 se a
+        # célula (r, c) é parede. Inteiros Python não têm limite de largura.
+        # Cada linha vira uma string de '0'/'1' (invertida: coluna 0 no bit 0)
+        # convertida por int(..., 2), tudo em C
+        grid = self._grid
+        self._wall_rows = [
+            int(grid[start:start + width].translate(_WALL_BIT_TABLE)[::-1], 2)
+            for start in range(0, len(grid), width)
+        ] if width else []
+        
+        # Contagem feita uma vez por layout; depois só decrementa ao comer
+        self._pellet_count = self._grid.count(2) + self._grid.count(3)
+        
+        # Layout novo: pellets e desenho em cache são refeitos na próxima consulta
+        # e quem guarda dados derivados das paredes compara layout_version
+        self._layout_version += 1
+        self._pellets_cache = None
+        self._draw_cache = {}
 
     def _validate_dimensions(self):
         """Valida se as dimensões do mapa são válidas."""
@@ -182,6 +452,11 @@ class Map:
     def cell_size(self):
         return self._cell_size
 
+    @property
+    def layout_version(self):
+        """Muda sempre que as paredes do mapa podem ter mudado (layout novo)."""
+        return self._layout_version
+
     @property
     def width(self):
         return self._width
@@ -217,14 +492,26 @@ class Map:
         if not os.path.exists(maps_dir):
             return []
         
-        maps = []
-        for file_path in glob.glob(os.path.join(maps_dir, "*.json")):
+        # scandir traz o mtime junto da listagem; só reabre arquivos novos ou alterados
+        seen = set()
+        for entry in os.scandir(maps_dir):
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            file_path = os.path.join(maps_dir, entry.name)
+            seen.add(file_path)
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                metadata = data.get('metadata', {})
-                maps.append({
+                mtime = entry.stat().st_mtime
+            except OSError as e:
+                logger.error("Erro ao carregar mapa %s: %s", file_path, e)
+                continue
+            
+            cached = _MAP_LIST_CACHE.get(file_path)
+            if cached is not None and cached[0] == mtime:
+                continue
+            
+            try:
+                metadata = _read_map_metadata(file_path)
+                _MAP_LIST_CACHE[file_path] = (mtime, {
                     'file_path': file_path,
                     'name': metadata.get('name', 'Mapa Sem Nome'),
                     'difficulty': metadata.get('difficulty', 50),
@@ -233,7 +520,16 @@ class Map:
                     'height': metadata.get('height', '?')
                 })
             except Exception as e:
-                print(f"Erro ao carregar mapa {file_path}: {e}")
+                _MAP_LIST_CACHE.pop(file_path, None)
+                logger.error("Erro ao carregar mapa %s: %s", file_path, e)
+        
+        # Esquece mapas removidos do diretório
+        for file_path in [p for p in _MAP_LIST_CACHE if p not in seen]:
+            del _MAP_LIST_CACHE[file_path]
+        
+        # Cópias, para que quem chama não altere o cache
+        maps = [dict(info) for path, (mtime, info) in _MAP_LIST_CACHE.items()
+                if path in seen]
         
         # Ordena por dificuldade (fácil para difícil)
         maps.sort(key=lambda m: m['difficulty'])
@@ -241,7 +537,7 @@ class Map:
 
     def load_default_map(self):
         """Carrega um mapa padrão para o jogo (fallback)"""
-        print("Carregando mapa padrão como fallback...")
+        logger.info("Carregando mapa padrão como fallback...")
         
         # Layout do labirinto (1=parede, 0=caminho, 2=pellet, 3=power_up)
         self._layout = [
@@ -290,17 +586,46 @@ class Map:
 
     def get_pellets(self):
         """Retorna lista de pellets baseada no layout do mapa"""
-        pellets = []
-        for row_idx, row in enumerate(self._layout):
-            for col_idx, cell in enumerate(row):
-                if cell == 2:  # Pellet normal
-                    x = col_idx * self._cell_size + self._cell_size // 2
-                    y = row_idx * self._cell_size + self._cell_size // 2
-                    pellets.append({"position": Vector2D(x, y), "type": "normal", "value": 10})
-                elif cell == 3:  # Power-up
-                    x = col_idx * self._cell_size + self._cell_size // 2
-                    y = row_idx * self._cell_size + self._cell_size // 2
-                    pellets.append({"position": Vector2D(x, y), "type": "power_up", "value": 50})
+        if self._pellets_cache is None:
+            self._pellets_cache = self._build_pellets()
+        return list(self._pellets_cache.values())
+
+    def get_pellet_arrays(self):
+        """
+        Retorna os pellets restantes como PelletArrays (estrutura de arrays).
+        
+        As células são localizadas por uma busca de regex sobre o grid, feita
+        em C, e as coordenadas saem direto para arrays tipados.
+        """
+        width = self._width
+        cell_size = self._cell_size
+        h = cell_size // 2
+        
+        indices = [m.start() for m in _PELLET_CELL.finditer(self._grid)]
+        col = array('i', [i % width for i in indices])
+        row = array('i', [i // width for i in indices])
+        kind = bytes(self._grid[i] for i in indices)
+        return PelletArrays(
+            x=array('d', [c * cell_size + h for c in col]),
+            y=array('d', [r * cell_size + h for r in row]),
+            col=col,
+            row=row,
+            kind=kind,
+            value=array('i', [_PELLET_KINDS[k][1] for k in kind]),
+        )
+
+    def _build_pellets(self):
+        """Varre o grid e monta os pellets indexados pela posição no grid"""
+        pellets = {}
+        grid = self._grid
+        # Só as células com pellet são visitadas; a busca no grid é feita em C
+        for match in _PELLET_CELL.finditer(grid):
+            index = match.start()
+            pellet_type, value = _PELLET_KINDS[grid[index]]
+            row_idx, col_idx = divmod(index, self._width)
+            x = col_idx * self._cell_size + self._cell_size // 2
+            y = row_idx * self._cell_size + self._cell_size // 2
+            pellets[index] = {"position": Vector2D(x, y), "type": pellet_type, "value": value}
         return pellets
 
     def get_spawn_position(self, entity_type="player"):
@@ -313,42 +638,70 @@ class Map:
         Returns:
             Vector2D: Posição de spawn
         """
-        return self._spawn_positions.get(
-            entity_type, 
-            Vector2D(self._cell_size, self._cell_size)  # Fallback
-        )
+        return self._spawn_positions.get(entity_type, self._fallback_spawn)
 
     def draw(self, screen, scale_factor=1.0, offset_x=0, offset_y=0):
         """Desenha o mapa na tela com escala"""
+        # O labirinto só muda ao carregar outro layout: é renderizado uma vez
+        # por escala numa Surface fora da tela e cada frame faz um único blit
+        surface = self._draw_cache.get(scale_factor)
+        if surface is None:
+            # Mantém só a escala atual (redimensionar a janela gera várias)
+            self._draw_cache.clear()
+            surface = self._draw_cache[scale_factor] = self._render_layout(scale_factor)
+        
+        screen.blit(surface, (offset_x, offset_y))
+
+    def _render_layout(self, scale_factor):
+        """Desenha o layout completo numa Surface própria (fundo preto) na escala dada"""
         scaled_cell_size = int(self._cell_size * scale_factor)
+        surface_width = int((self._width - 1) * self._cell_size * scale_factor) + scaled_cell_size
+        surface_height = int((self._height - 1) * self._cell_size * scale_factor) + scaled_cell_size
+        surface = pygame.Surface((max(surface_width, 1), max(surface_height, 1)))
         
-        for row_idx, row in enumerate(self._layout):
-            for col_idx, cell in enumerate(row):
-                x = int(col_idx * self._cell_size * scale_factor) + offset_x
-                y = int(row_idx * self._cell_size * scale_factor) + offset_y
-                rect = pygame.Rect(x, y, scaled_cell_size, scaled_cell_size)
-                
+        # Coordenadas de tela de cada coluna/linha calculadas uma vez; o laço
+        # interno só consulta as tabelas e reposiciona o mesmo Rect
+        step = self._cell_size * scale_factor
+        xs = [int(col_idx * step) for col_idx in range(self._width)]
+        ys = [int(row_idx * step) for row_idx in range(self._height)]
+        rect = pygame.Rect(0, 0, scaled_cell_size, scaled_cell_size)
+        border_width = max(1, int(1 * scale_factor))
+        fill = surface.fill
+        draw_rect = pygame.draw.rect
+        
+        for y, row in zip(ys, self._layout):
+            rect.y = y
+            for x, cell in zip(xs, row):
+                # Caminhos ficam com o preto de fundo da Surface nova
                 if cell == 1:  # Parede
+                    rect.x = x
                     # Desenho procedural das paredes (sem sprites disponíveis)
-                    pygame.draw.rect(screen, (0, 0, 255), rect)  # Azul para paredes
-                    
-                    border_width = max(1, int(1 * scale_factor))
-                    pygame.draw.rect(screen, (0, 0, 200), rect, border_width)
-                elif cell == 0:  # Caminho vazio
-                    pygame.draw.rect(screen, (0, 0, 0), rect)  # Preto para caminhos
+                    fill((0, 0, 255), rect)  # Azul para paredes
+                    draw_rect(surface, (0, 0, 200), rect, border_width)
+        
+        return surface
 
     def is_wall(self, position: Vector2D):
         """Verifica se uma posição é uma parede"""
+        return self._is_wall_xy(position.x, position.y)
+
+    def _is_wall_xy(self, x, y):
+        """Versão de is_wall que recebe as coordenadas do mundo soltas"""
+        # Atributos lidos uma vez em variáveis locais (método chamado muitas vezes por frame)
+        cell = self._cell_size
+        width = self._width
+        
         # Converte posição do mundo para coordenadas da grade
-        col = int(position.x // self._cell_size)
-        row = int(position.y // self._cell_size)
+        # (divisão com piso: posições negativas caem fora do mapa)
+        col = int(x // cell)
+        row = int(y // cell)
         
         # Verifica limites
-        if row < 0 or row >= self._height or col < 0 or col >= self._width:
+        if row < 0 or row >= self._height or col < 0 or col >= width:
             return True
         
         # Retorna True se for parede (1)
-        return self._layout[row][col] == 1
+        return self._grid[row * width + col] == 1
 
     def is_valid_position(self, position: Vector2D, object_size=16, type="player"):
         """
@@ -362,52 +715,55 @@ class Map:
         Returns:
             bool: True se a posição for válida (sem colisão com paredes)
         """
-        # Define diferentes margens para diferentes tipos de entidades
-        # Margens menores = controle mais preciso, mas mais difícil passar por espaços apertados
-        # Margens maiores = controle mais fluido, mas pode causar colisões aparentemente incorretas
-        if type == "player":
-            # Player tem margem mais apertada para movimento mais preciso e controle responsivo
-            # Permite ao jogador navegar por corredores estreitos com mais facilidade
-            half_size = object_size // 2.125
-        elif type == "ghost":
-            # Fantasmas têm margem ligeiramente mais generosa para movimento mais fluido
-            # Evita que os fantasmas fiquem "presos" em situações de pathfinding
-            half_size = object_size // 3  
-        else:
-            # Default para outros objetos (pellets, itens especiais, etc.)
-            half_size = object_size //3 
-        
-        corners = [
-            Vector2D(position.x - half_size, position.y - half_size),
-            Vector2D(position.x + half_size, position.y - half_size),
-            Vector2D(position.x - half_size, position.y + half_size),
-            Vector2D(position.x + half_size, position.y + half_size)
-        ]
+        return self.is_valid_xy(position.x, position.y, object_size, type)
+
+    def is_valid_xy(self, x, y, object_size=16, type="player"):
+        """
+        Mesma verificação de is_valid_position, recebendo x e y soltos.
         
-        for corner in corners:
-            if self.is_wall(corner):
-                return False
-        return True
+        Usada no laço de movimento para não alocar um Vector2D por consulta.
+        """
+        half_size = object_size // _COLLISION_DIVISORS.get(type, _DEFAULT_COLLISION_DIVISOR)
+        
+        # Células dos quatro cantos da caixa do objeto (col1 <= col2, row1 <= row2)
+        cell = self._cell_size
+        col1 = int((x - half_size) // cell)
+        col2 = int((x + half_size) // cell)
+        row1 = int((y - half_size) // cell)
+        row2 = int((y + half_size) // cell)
+        
+        # Fora dos limites conta como parede
+        if col1 < 0 or row1 < 0 or col2 >= self._width or row2 >= self._height:
+            return False
+        
+        # Junta as duas linhas e testa as duas colunas: cobre os quatro cantos
+        wall_rows = self._wall_rows
+        row_bits = wall_rows[row1] | wall_rows[row2]
+        return not (((row_bits >> col1) | (row_bits >> col2)) & 1)
 
     def remove_pellet_at(self, position: Vector2D):
         """Remove um pellet na posição especificada"""
-        col = int(position.x // self._cell_size)
-        row = int(position.y // self._cell_size)
+        cell = self._cell_size
+        width = self._width
+        grid = self._grid
+        
+        col = int(position.x // cell)
+        row = int(position.y // cell)
         
-        if 0 <= row < self._height and 0 <= col < self._width:
-            if self._layout[row][col] in [2, 3]:  # Se é pellet ou power-up
-                self._layout[row][col] = 0  # Torna caminho vazio
+        if 0 <= row < self._height and 0 <= col < width:
+            index = row * width + col
+            if grid[index] >= 2:  # Se é pellet ou power-up
+                grid[index] = 0  # Torna caminho vazio
+                self._layout[row][col] = 0
+                self._pellet_count -= 1
+                if self._pellets_cache is not None:
+                    del self._pellets_cache[index]
                 return True
         return False
 
     def count_pellets(self):
         """Conta quantos pellets restam no mapa"""
-        count = 0
-        for row in self._layout:
-            for cell in row:
-                if cell in [2, 3]:  # Pellet normal ou power-up
-                    count += 1
-        return count 
+        return self._pellet_count
     
     def reset_map(self):
         """Reseta o mapa para o estado inicial, restaurando todos os pellets"""
@@ -1,9 +1,26 @@
 import pygame
+import logging
 import os
 import time
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from typing import Dict, Optional, List
 
+logger = logging.getLogger(__name__)
+
+# Threads usadas para decodificar os sons em segundo plano
+_MAX_PRELOAD_WORKERS = 4
+
+# Sons tocados logo no início (música do menu e efeitos do começo da partida):
+# só eles são decodificados em segundo plano; o resto carrega no primeiro uso,
+# para a memória ficar proporcional aos sons que o jogo realmente toca
+_PRELOAD_SOUNDS = ("music_menu", "eating", "eating-ghost", "ghost-turn-to-blue", "miss")
+
+# Última reprodução de um som que ainda não tocou: longe o bastante no passado
+# para qualquer intervalo mínimo
+_NEVER_PLAYED = -(1 << 62)
+
 class SoundType(Enum):
     """Enum para categorizar diferentes tipos de som"""
     EFFECT = "effect"      # Efeitos sonoros (comer pellet, power-up, etc.)
@@ -24,14 +41,19 @@ class SoundManager:
         # Inicializa o mixer do Pygame
         try:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-            print("Mixer do Pygame inicializado com sucesso")
+            logger.info("Mixer do Pygame inicializado com sucesso")
         except Exception as e:
-            print(f"Erro ao inicializar mixer do Pygame: {e}")
+            logger.error("Erro ao inicializar mixer do Pygame: %s", e)
             return
         
-        self._sounds: Dict[str, pygame.mixer.Sound] = {}
+        self._sounds: Dict[str, pygame.mixer.Sound] = {}  # Sons já carregados
+        self._path_index: Dict[str, str] = {}  # Nome do som -> arquivo
+        self._pending: Dict[str, Future] = {}  # Sons sendo carregados em segundo plano
+        self._play_info: Dict[str, tuple] = {}  # Cache de play_sound, ver _build_play_info
+        self._current_volume: Dict[str, float] = {}  # Último volume aplicado a cada som
         self._music_channel: Optional[pygame.mixer.Channel] = None
         self._effect_channels: List[pygame.mixer.Channel] = []
+        self._effect_rr = 0  # Próximo canal de efeito do rodízio
         self._ui_channel: Optional[pygame.mixer.Channel] = None
         self._ghost_channel: Optional[pygame.mixer.Channel] = None
         
@@ -43,9 +65,12 @@ class SoundManager:
             SoundType.GHOST: 0.6
         }
         
-        # Controle de sobreposição - armazena último tempo de reprodução
-        self._last_play_times: Dict[str, float] = {}
-        self._min_interval = 0.5 # Intervalo mínimo entre reproduções (segundos)
+        # Controle de sobreposição - armazena último instante de reprodução
+        # em nanossegundos do relógio monotônico (não volta com ajustes de hora),
+        # numa posição fixa por som (ver _index_sounds)
+        self._sound_ids: Dict[str, int] = {}
+        self._last_play_times = array('q')
+        self._min_interval_ns = 500_000_000  # Intervalo mínimo entre reproduções (0.5s)
         
         # Mapeamento de sons para seus tipos
         self._sound_types = {
@@ -74,7 +99,8 @@ class SoundManager:
         }
         
         self._initialize_channels()
-        self._load_all_sounds()
+        self._index_sounds()
+        self._preload_in_background()
     
     def _initialize_channels(self):
         """Inicializa os canais de áudio do Pygame"""
@@ -94,79 +120,160 @@ class SoundManager:
                 pygame.mixer.Channel(5)
             ]
             
-            print("Canais de áudio inicializados com sucesso")
+            logger.info("Canais de áudio inicializados com sucesso")
         except Exception as e:
-            print(f"Erro ao inicializar canais de áudio: {e}")
+            logger.error("Erro ao inicializar canais de áudio: %s", e)
+        
+        # Canal de cada som resolvido uma vez: canal fixo do tipo ou a lista de
+        # canais de efeito (sons fora do mapeamento também são efeitos)
+        channel_by_type = {
+            SoundType.MUSIC: self._music_channel,
+            SoundType.UI: self._ui_channel,
+            SoundType.GHOST: self._ghost_channel,
+            SoundType.EFFECT: self._effect_channels,
+        }
+        self._channel_of = {
+            sound_name: channel_by_type[sound_type]
+            for sound_name, sound_type in self._sound_types.items()
+        }
     
-    def _load_all_sounds(self):
-        """Carrega todos os sons disponíveis na pasta assets/sounds"""
+    def _index_sounds(self):
+        """
+        Indexa os sons disponíveis na pasta assets/sounds sem carregá-los.
+        
+        A decodificação fica fora da inicialização: os sons do início são
+        feitos em segundo plano (_preload_in_background) e os demais no
+        primeiro uso (_get_sound).
+        """
         sounds_path = "assets/sounds"
         
         if not os.path.exists(sounds_path):
-            print(f"Aviso: Pasta de sons não encontrada em {sounds_path}")
+            logger.warning("Pasta de sons não encontrada em %s", sounds_path)
             return
         
         try:
-            for filename in os.listdir(sounds_path):
-                if filename.endswith(('.wav', '.mp3', '.ogg')):
-                    sound_name = os.path.splitext(filename)[0]
-                    file_path = os.path.join(sounds_path, filename)
-                    
-                    try:
-                        sound = pygame.mixer.Sound(file_path)
-                        self._sounds[sound_name] = sound
-                        print(f"Som carregado: {sound_name}")
-                    except Exception as e:
-                        print(f"Erro ao carregar som {filename}: {e}")
+            for entry in os.scandir(sounds_path):
+                if entry.name.endswith(('.wav', '.mp3', '.ogg')):
+                    self._path_index[os.path.splitext(entry.name)[0]] = entry.path
             
-            print(f"Total de sons carregados: {len(self._sounds)}")
+            # Cada som ganha uma posição fixa no array de últimas reproduções
+            self._sound_ids = {name: i for i, name in enumerate(self._path_index)}
+            self._last_play_times = array('q', [_NEVER_PLAYED]) * len(self._sound_ids)
+            
+            logger.info("Total de sons disponíveis: %d", len(self._path_index))
         except Exception as e:
-            print(f"Erro ao carregar sons: {e}")
+            logger.error("Erro ao indexar sons: %s", e)
+    
+    def _preload_in_background(self):
+        """
+        Começa a decodificar os sons de _PRELOAD_SOUNDS em threads de fundo.
+        
+        Não bloqueia a inicialização: cada som fica como um Future em
+        _pending e _get_sound recolhe o resultado quando o som é usado.
+        A decodificação do pygame libera o GIL, então o jogo segue rodando.
+        """
+        preload = [name for name in _PRELOAD_SOUNDS if name in self._path_index]
+        if not preload:
+            return
+        
+        workers = min(_MAX_PRELOAD_WORKERS, os.cpu_count() or 1, len(preload))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sound-preload")
+        for sound_name in preload:
+            self._pending[sound_name] = executor.submit(pygame.mixer.Sound, self._path_index[sound_name])
+        # Libera as threads assim que a fila esvaziar, sem esperar aqui
+        executor.shutdown(wait=False)
+    
+    def _get_sound(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        """Retorna o som já carregado ou o carrega do disco no primeiro uso"""
+        sound = self._sounds.get(sound_name)
+        if sound is not None:
+            return sound
+        
+        file_path = self._path_index.get(sound_name)
+        if file_path is None:
+            return None
+        
+        # Só a thread principal mexe em _sounds e _pending: o resultado da
+        # carga em segundo plano é recolhido aqui, sem precisar de lock
+        future = self._pending.pop(sound_name, None)
+        try:
+            if future is not None:
+                sound = future.result()
+            else:
+                sound = pygame.mixer.Sound(file_path)
+        except Exception as e:
+            logger.error("Erro ao carregar som %s: %s", os.path.basename(file_path), e)
+            # Não tenta de novo a cada reprodução
+            del self._path_index[sound_name]
+            return None
+        
+        self._sounds[sound_name] = sound
+        return sound
     
     def _get_channel_for_sound(self, sound_name: str) -> Optional[pygame.mixer.Channel]:
         """Retorna o canal apropriado para um som específico"""
-        sound_type = self._sound_types.get(sound_name, SoundType.EFFECT)
+        return self._pick_channel(self._channel_of.get(sound_name, self._effect_channels))
+    
+    @staticmethod
+    def _pick_channel(resolver) -> Optional[pygame.mixer.Channel]:
+        """Resolve o canal de _channel_of: fixo, ou o primeiro canal de efeito livre"""
+        if not isinstance(resolver, list):
+            return resolver
+        # Escolhe um canal de efeito disponível
+        for channel in resolver:
+            if not channel.get_busy():
+                return channel
+        # Se todos estiverem ocupados, usa o primeiro
+        return resolver[0] if resolver else None
+    
+    def _next_effect_channel(self) -> Optional[pygame.mixer.Channel]:
+        """
+        Próximo canal de efeito em rodízio, sem consultar se está ocupado.
         
-        if sound_type == SoundType.MUSIC:
-            return self._music_channel
-        elif sound_type == SoundType.UI:
-            return self._ui_channel
-        elif sound_type == SoundType.GHOST:
-            return self._ghost_channel
-        else:  # SoundType.EFFECT
-            # Escolhe um canal de efeito disponível
-            for channel in self._effect_channels:
-                if not channel.get_busy():
-                    return channel
-            # Se todos estiverem ocupados, usa o primeiro
-            return self._effect_channels[0] if self._effect_channels else None
+        Se o canal ainda estiver tocando, o efeito mais antigo é interrompido.
+        """
+        channels = self._effect_channels
+        if not channels:
+            return None
+        channel = channels[self._effect_rr]
+        self._effect_rr = (self._effect_rr + 1) % len(channels)
+        return channel
     
     def _can_play_sound(self, sound_name: str) -> bool:
         """
         Verifica se um som pode ser reproduzido (evita sobreposição indesejada)
+        
+        Nomes desconhecidos nunca podem: o controle de intervalo só tem espaço
+        para os sons indexados, então um nome errado não cria estado novo.
         """
-        current_time = time.time()
-        last_play_time = self._last_play_times.get(sound_name, 0)
+        sound_id = self._sound_ids.get(sound_name)
+        if sound_id is None:
+            return False
+        now = time.monotonic_ns()
         
         # Permite reprodução se passou tempo suficiente desde a última
-        if current_time - last_play_time >= self._min_interval:
-            self._last_play_times[sound_name] = current_time
+        if now - self._last_play_times[sound_id] >= self._min_interval_ns:
+            self._last_play_times[sound_id] = now
             return True
         return False
     
-    def play_sound(self, sound_name: str, volume: Optional[float] = None) -> bool:
+    def play_sound(self, sound_name: str, volume: Optional[float] = None,
+                   prefer_idle: bool = False) -> bool:
         """
         Reproduz um som específico.
         
         Args:
             sound_name: Nome do som a ser reproduzido
             volume: Volume específico (opcional, usa volume padrão se não fornecido)
+            prefer_idle: Para efeitos, procura um canal livre antes de
+                interromper outro (padrão: rodízio entre os canais de efeito)
             
         Returns:
             bool: True se o som foi reproduzido com sucesso, False caso contrário
         """
-        if sound_name not in self._sounds:
-            print(f"Aviso: Som '{sound_name}' não encontrado")
+        info = self._play_info.get(sound_name)
+        if info is None and sound_name not in self._path_index:
+            logger.warning("Som '%s' não encontrado", sound_name)
             return False
         
         # Verifica se pode reproduzir (evita sobreposição)
@@ -174,28 +281,55 @@ class SoundManager:
             return False
         
         try:
-            sound = self._sounds[sound_name]
-            channel = self._get_channel_for_sound(sound_name)
+            if info is None:
+                info = self._build_play_info(sound_name)
+                if info is None:
+                    return False
+            sound, resolver, type_volume = info
+            
+            if resolver is self._effect_channels and not prefer_idle:
+                channel = self._next_effect_channel()
+            else:
+                channel = self._pick_channel(resolver)
             
             if channel is None:
-                print(f"Erro: Nenhum canal disponível para {sound_name}")
+                logger.error("Nenhum canal disponível para %s", sound_name)
                 return False
             
             # Define o volume
-            if volume is not None:
-                sound.set_volume(volume)
-            else:
-                sound_type = self._sound_types.get(sound_name, SoundType.EFFECT)
-                sound.set_volume(self._volumes[sound_type])
+            self._apply_volume(sound_name, sound, volume if volume is not None else type_volume)
             
             # Reproduz o som
             channel.play(sound)
             return True
             
         except Exception as e:
-            print(f"Erro ao reproduzir som {sound_name}: {e}")
+            logger.error("Erro ao reproduzir som %s: %s", sound_name, e)
             return False
     
+    def _apply_volume(self, sound_name: str, sound: pygame.mixer.Sound, volume: float):
+        """Aplica o volume ao som só se for diferente do último aplicado"""
+        if self._current_volume.get(sound_name) != volume:
+            sound.set_volume(volume)
+            self._current_volume[sound_name] = volume
+    
+    def _build_play_info(self, sound_name: str):
+        """
+        Monta e guarda em _play_info o que play_sound precisa de um som:
+        (Sound, canal fixo ou lista de canais de efeito, volume do tipo).
+        
+        Returns:
+            tuple ou None se o som não puder ser carregado
+        """
+        sound = self._get_sound(sound_name)
+        if sound is None:
+            return None
+        
+        sound_type = self._sound_types.get(sound_name, SoundType.EFFECT)
+        resolver = self._channel_of.get(sound_name, self._effect_channels)
+        info = self._play_info[sound_name] = (sound, resolver, self._volumes[sound_type])
+        return info
+    
     def stop_sound(self, sound_name: str) -> bool:
         """
         Para a reprodução de um som específico.
@@ -213,7 +347,7 @@ class SoundManager:
                 return True
             return False
         except Exception as e:
-            print(f"Erro ao parar som {sound_name}: {e}")
+            logger.error("Erro ao parar som %s: %s", sound_name, e)
             return False
     
     def pause_sound(self, sound_name: str) -> bool:
@@ -233,7 +367,7 @@ class SoundManager:
                 return True
             return False
         except Exception as e:
-            print(f"Erro ao pausar som {sound_name}: {e}")
+            logger.error("Erro ao pausar som %s: %s", sound_name, e)
             return False
     
     def unpause_sound(self, sound_name: str) -> bool:
@@ -253,7 +387,7 @@ class SoundManager:
                 return True
             return False
         except Exception as e:
-            print(f"Erro ao despausar som {sound_name}: {e}")
+            logger.error("Erro ao despausar som %s: %s", sound_name, e)
             return False
     
     def set_volume(self, sound_type: SoundType, volume: float) -> bool:
@@ -268,15 +402,22 @@ class SoundManager:
             bool: True se o volume foi definido, False caso contrário
         """
         if not 0.0 <= volume <= 1.0:
-            print(f"Erro: Volume deve estar entre 0.0 e 1.0, recebido: {volume}")
+            logger.error("Volume deve estar entre 0.0 e 1.0, recebido: %s", volume)
             return False
         
         self._volumes[sound_type] = volume
         
-        # Atualiza volume de todos os sons do tipo especificado
+        # Atualiza volume dos sons do tipo especificado que já foram carregados
+        # (os demais recebem o volume do tipo ao tocar)
         for sound_name, sound in self._sounds.items():
             if self._sound_types.get(sound_name) == sound_type:
-                sound.set_volume(volume)
+                self._apply_volume(sound_name, sound, volume)
+        
+        # Sons já tocados guardam o volume do tipo em _play_info: monta de novo
+        # só as entradas do tipo alterado
+        for sound_name in list(self._play_info):
+            if self._sound_types.get(sound_name, SoundType.EFFECT) == sound_type:
+                self._build_play_info(sound_name)
         
         return True
     
@@ -291,19 +432,22 @@ class SoundManager:
         Returns:
             bool: True se o volume foi definido, False caso contrário
         """
-        if sound_name not in self._sounds:
-            print(f"Erro: Som '{sound_name}' não encontrado")
+        if sound_name not in self._path_index:
+            logger.error("Som '%s' não encontrado", sound_name)
             return False
         
         if not 0.0 <= volume <= 1.0:
-            print(f"Erro: Volume deve estar entre 0.0 e 1.0, recebido: {volume}")
+            logger.error("Volume deve estar entre 0.0 e 1.0, recebido: %s", volume)
             return False
         
         try:
-            self._sounds[sound_name].set_volume(volume)
+            sound = self._get_sound(sound_name)
+            if sound is None:
+                return False
+            self._apply_volume(sound_name, sound, volume)
             return True
         except Exception as e:
-            print(f"Erro ao definir volume para {sound_name}: {e}")
+            logger.error("Erro ao definir volume para %s: %s", sound_name, e)
             return False
     
     def get_volume(self, sound_type: SoundType) -> float:
@@ -323,21 +467,21 @@ class SoundManager:
         try:
             pygame.mixer.stop()
         except Exception as e:
-            print(f"Erro ao parar todos os sons: {e}")
+            logger.error("Erro ao parar todos os sons: %s", e)
     
     def pause_all_sounds(self):
         """Pausa todos os sons em reprodução"""
         try:
             pygame.mixer.pause()
         except Exception as e:
-            print(f"Erro ao pausar todos os sons: {e}")
+            logger.error("Erro ao pausar todos os sons: %s", e)
     
     def unpause_all_sounds(self):
         """Despausa todos os sons"""
         try:
             pygame.mixer.unpause()
         except Exception as e:
-            print(f"Erro ao despausar todos os sons: {e}")
+            logger.error("Erro ao despausar todos os sons: %s", e)
     
     def is_sound_playing(self, sound_name: str) -> bool:
         """
@@ -353,7 +497,7 @@ class SoundManager:
             channel = self._get_channel_for_sound(sound_name)
             return channel is not None and channel.get_busy()
         except Exception as e:
-            print(f"Erro ao verificar se {sound_name} está tocando: {e}")
+            logger.error("Erro ao verificar se %s está tocando: %s", sound_name, e)
             return False
     
     def get_available_sounds(self) -> List[str]:
@@ -361,9 +505,9 @@ class SoundManager:
         Retorna lista de todos os sons disponíveis.
         
         Returns:
-            List[str]: Lista com nomes dos sons carregados
+            List[str]: Lista com nomes dos sons disponíveis (carregados ou não)
         """
-        return list(self._sounds.keys())
+        return list(self._path_index)
     
     def get_sound_type(self, sound_name: str) -> Optional[SoundType]:
         """
@@ -385,9 +529,9 @@ class SoundManager:
             interval: Intervalo em segundos
         """
         if interval >= 0:
-            self._min_interval = interval
+            self._min_interval_ns = int(interval * 1_000_000_000)
         else:
-            print("Erro: Intervalo deve ser maior ou igual a 0")
+            logger.error("Intervalo deve ser maior ou igual a 0")
     
     def get_min_interval(self) -> float:
         """
@@ -396,7 +540,23 @@ class SoundManager:
         Returns:
             float: Intervalo em segundos
         """
-        return self._min_interval
+        return self._min_interval_ns / 1_000_000_000
+
+# Instância global do gerenciador de sons, criada só no primeiro uso: importar
+# o módulo não dispara carregamento de arquivos nem inicialização do pygame
+_sound_manager = None
+
+
+def get_sound_manager() -> SoundManager:
+    """Retorna a instância global do gerenciador de sons, criando-a se preciso"""
+    global _sound_manager
+    if _sound_manager is None:
+        _sound_manager = SoundManager()
+    return _sound_manager
+
 
-# Instância global do gerenciador de sons
-sound_manager = SoundManager() 
\ No newline at end of file
+def __getattr__(name):
+    # Mantém "from ... import sound_manager" funcionando (PEP 562)
+    if name == "sound_manager":
+        return get_sound_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
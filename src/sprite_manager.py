@@ -1,53 +1,249 @@
 import pygame
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from enum import IntEnum
 from .utils import Direction
 
+logger = logging.getLogger(__name__)
+
+# Tamanho (px) dos sprites na escala base; também é o tamanho de colisão das
+# entidades e o tamanho padrão de célula do mapa
+BASE_SPRITE_SIZE = 16
+
+# Threads usadas para carregar arquivos de sprite em paralelo
+_MAX_LOAD_WORKERS = 4
+
+# Gera os sprites de fantasma virados para a esquerda espelhando os da direita
+# (a arte atual é simétrica assim). Desligue se uma arte nova não for; cima e
+# baixo nunca são derivados, pois os olhos não são simétricos nesse eixo.
+_MIRROR_GHOST_LEFT = True
+
+# Colunas de sprites no atlas montado no carregamento
+_ATLAS_COLUMNS = 8
+
+# Quantas escalas anteriores têm suas Surfaces guardadas para reuso
+_MAX_POOLED_SCALES = 3
+
+_PACMAN_VARIANTS = ('closed', 'right', 'right_open', 'left', 'left_open',
+                    'up', 'up_open', 'down', 'down_closed')
+_GHOST_COLORS = ('red', 'pink', 'blue', 'yellow')
+_GHOST_DIRECTIONS = ('up', 'down', 'left', 'right')
+_VULNERABLE_VARIANTS = ('blue_1', 'blue_2', 'white_1', 'white_2')
+
+# (direção, nome da direção no arquivo, frame) de cada sprite de fantasma,
+# na mesma ordem dos membros GHOST_* de SpriteId
+_GHOST_VARIANTS = tuple(
+    (direction, file_direction, frame)
+    for direction, file_direction in zip(_GHOST_DIRECTIONS, ('cima', 'baixo', 'esq', 'dir'))
+    for frame in (1, 2)
+)
+
+# Índice de cada sprite na lista plana do SpriteManager. Os sprites de um
+# fantasma ficam em sequência: cor + direção * 2 + (frame - 1)
+SpriteId = IntEnum('SpriteId', [
+    *(f"PACMAN_{variant.upper()}" for variant in _PACMAN_VARIANTS),
+    *(f"GHOST_{color.upper()}_{direction.upper()}_{frame}"
+      for color in _GHOST_COLORS for direction in _GHOST_DIRECTIONS for frame in (1, 2)),
+    *(f"VULNERABLE_{variant.upper()}" for variant in _VULNERABLE_VARIANTS),
+    "FRUIT",
+    "PELLET_NORMAL",
+    "PELLET_POWER_UP",
+], start=0)
+
+# Direção do Pac-Man -> (sprite com a boca fechada, sprite com a boca aberta)
+_PACMAN_BY_DIRECTION = {
+    Direction.RIGHT: (SpriteId.PACMAN_RIGHT, SpriteId.PACMAN_RIGHT_OPEN),
+    Direction.LEFT: (SpriteId.PACMAN_LEFT, SpriteId.PACMAN_LEFT_OPEN),
+    Direction.UP: (SpriteId.PACMAN_UP, SpriteId.PACMAN_UP_OPEN),
+    Direction.DOWN: (SpriteId.PACMAN_DOWN_CLOSED, SpriteId.PACMAN_DOWN),
+}
+_PACMAN_STOPPED = (SpriteId.PACMAN_CLOSED, SpriteId.PACMAN_CLOSED)
+
+# Tipo do fantasma -> primeiro sprite da sua cor (cyan usa os azuis e orange
+# os amarelos); tipos desconhecidos usam o vermelho
+_GHOST_BASE = {
+    "red": SpriteId.GHOST_RED_UP_1,
+    "pink": SpriteId.GHOST_PINK_UP_1,
+    "cyan": SpriteId.GHOST_BLUE_UP_1,
+    "orange": SpriteId.GHOST_YELLOW_UP_1,
+}
+# Tabelas de animação indexadas por animation_frame % len(tabela); cada uma
+# cobre exatamente um período, então o resultado é o mesmo das contas originais
+# Pac-Man: boca aberta (1) ou fechada (0), troca a cada 10 frames
+_PACMAN_OPEN_LUT = array('B', [(f // 10) % 2 == 0 for f in range(20)])
+# Fantasma: frame 1 (0) ou 2 (1), troca a cada 20 frames
+_GHOST_FRAME_LUT = array('B', [(f // 20) % 2 for f in range(40)])
+# Vulnerável: azul 1, azul 2, branco 1, branco 2 (deslocamento a partir de
+# VULNERABLE_BLUE_1), troca a cada 15 frames
+_VULNERABLE_LUT = array('B', [(f // 15) % 4 for f in range(60)])
+# Power-up: visível (1) ou apagado (0), pisca a cada 15 frames
+_POWER_UP_VISIBLE_LUT = array('B', [(f // 15) % 2 == 0 for f in range(30)])
+
+_GHOST_DIRECTION_OFFSET = {
+    Direction.UP: 0,
+    Direction.DOWN: 2,
+    Direction.LEFT: 4,
+    Direction.RIGHT: 6,
+}
+
 class SpriteManager:
     """Gerenciador de sprites para o jogo Pac-Man"""
     
     def __init__(self):
-        self._sprites = {}
-        self._base_sprite_size = 16  
-        self._current_sprite_size = 16 
+        # Sprites na escala base, indexados por SpriteId
+        self._sprites = [None] * len(SpriteId)
+        self._base_sprite_size = BASE_SPRITE_SIZE
+        self._current_sprite_size = BASE_SPRITE_SIZE
         self._scale_factor = 1.0  
-        self._scaled_sprites = {}  
+        self._scaled_sprites = []  # Mesmos índices, na escala atual
+        self._active_sprites = self._sprites  # Lista consultada pelos getters
+        self._ghost_dispatch = {}  # Tipo do fantasma -> seus 8 sprites na escala atual
+        self._surface_pool = {}  # Surfaces escaladas livres, ver _acquire_surface
+        self._atlas = None  # Surface única com todos os sprites carregados de arquivo
+        self._display_converted = False  # Sprites já no formato de pixel da tela?
+        # Um só sprite magenta compartilhado por todos os arquivos que faltarem
+        self._default_sprite = self._create_default_sprite()
+        # Power-up apagado (piscando): um só sprite transparente por escala
+        self._blank_sprite = self._create_blank_sprite()
         self._load_all_sprites()
+        # Se a janela já existe converte agora; senão o jogo chama depois de criá-la
+        self.convert_for_display()
+    
+    def convert_for_display(self):
+        """
+        Converte os sprites para o formato de pixel da tela (convert_alpha).
+        
+        Com o mesmo formato, cada blit vira uma cópia direta, sem conversão de
+        pixels dentro do SDL. Precisa de uma janela criada (display.set_mode):
+        sem ela não faz nada.
+        
+        Returns:
+            bool: True se os sprites estão no formato da tela
+        """
+        if self._display_converted:
+            return True
+        if pygame.display.get_surface() is None:
+            return False
+        
+        atlas = self._atlas
+        converted_atlas = atlas.convert_alpha() if atlas is not None else None
+        converted = {}  # id do original -> convertido (fruta e power-up são o mesmo sprite)
+        
+        def convert(sprite):
+            result = converted.get(id(sprite))
+            if result is None:
+                if converted_atlas is not None and sprite.get_parent() is atlas:
+                    # Recorta do atlas convertido: continua um só buffer de pixels
+                    result = converted_atlas.subsurface(pygame.Rect(sprite.get_offset(), sprite.get_size()))
+                else:
+                    result = sprite.convert_alpha()
+                converted[id(sprite)] = result
+            return result
+        
+        self._sprites = [convert(sprite) for sprite in self._sprites]
+        self._default_sprite = convert(self._default_sprite)
+        self._atlas = converted_atlas
+        self._display_converted = True
+        self._blank_sprite = self._create_blank_sprite()
+        
+        # Versões escaladas refeitas a partir dos sprites convertidos
+        self._prescale_all_sprites()
+        return True
     
     def set_scale_factor(self, scale_factor):
         """Define o fator de escala para os sprites"""
         if scale_factor != self._scale_factor:
             self._scale_factor = scale_factor
             self._current_sprite_size = int(self._base_sprite_size * scale_factor)
-            self._scaled_sprites.clear()  
-            print(f"Escala de sprites alterada: {scale_factor:.2f}x (tamanho: {self._current_sprite_size}px)")
+            self._blank_sprite = self._create_blank_sprite()
+            self._prescale_all_sprites()
+            logger.info("Escala de sprites alterada: %.2fx (tamanho: %dpx)", scale_factor, self._current_sprite_size)
     
-    def _get_scaled_sprite(self, sprite_key, sprite):
-        """Retorna uma versão escalada do sprite, usando cache quando possível"""
+    def _prescale_all_sprites(self):
+        """
+        Escala todos os sprites carregados de uma vez para a escala atual.
+        
+        Troca de escala é rara (redimensionar a janela); fazer todo o trabalho
+        aqui evita uma rajada de escalas no primeiro frame desenhado depois dela
+        e deixa os getters sem nenhum teste de cache.
+        """
+        # As Surfaces da escala anterior voltam para o pool e podem ser
+        # reaproveitadas (sem nova alocação) se essa escala voltar a ser usada
+        self._release_scaled_sprites()
+        
         if self._scale_factor == 1.0:
-            return sprite
-            
-        cache_key = f"{sprite_key}_{self._scale_factor}"
-        if cache_key not in self._scaled_sprites:
+            self._active_sprites = self._sprites
+        else:
             new_size = (self._current_sprite_size, self._current_sprite_size)
-            self._scaled_sprites[cache_key] = pygame.transform.scale(sprite, new_size)
+            scale = pygame.transform.scale
+            self._scaled_sprites = [
+                scale(sprite, new_size, self._acquire_surface(sprite, new_size))
+                for sprite in self._sprites
+            ]
+            self._active_sprites = self._scaled_sprites
+        self._build_ghost_dispatch()
+    
+    def _build_ghost_dispatch(self):
+        """
+        Monta a tabela tipo do fantasma -> tupla com os 8 sprites da sua cor.
+        
+        Os sprites de cada cor são consecutivos em SpriteId (cima, baixo,
+        esquerda, direita; frames 1 e 2), então a tupla é indexada direto por
+        _GHOST_DIRECTION_OFFSET + frame. Refeita sempre que _active_sprites muda.
+        """
+        active = self._active_sprites
+        self._ghost_dispatch = {
+            ghost_type: tuple(active[base:base + 8])
+            for ghost_type, base in _GHOST_BASE.items()
+        }
+    
+    @staticmethod
+    def _surface_pool_key(sprite, size):
+        """Chave do pool: Surfaces só são trocáveis com mesmo tamanho e formato"""
+        return (size, sprite.get_flags(), sprite.get_bitsize(), sprite.get_masks())
+    
+    def _acquire_surface(self, sprite, size):
+        """Retorna uma Surface de destino do pool ou cria uma no formato do sprite"""
+        free = self._surface_pool.get(self._surface_pool_key(sprite, size))
+        if free:
+            return free.pop()
+        # Máscaras explícitas: passar o sprite como modelo não preserva a ordem RGBA
+        return pygame.Surface(size, sprite.get_flags(), sprite.get_bitsize(), sprite.get_masks())
+    
+    def _release_scaled_sprites(self):
+        """Devolve as Surfaces escaladas atuais ao pool"""
+        pool = self._surface_pool
+        for sprite in self._scaled_sprites:
+            key = self._surface_pool_key(sprite, sprite.get_size())
+            pool.setdefault(key, []).append(sprite)
+            # Mais recente por último: as chaves mais antigas saem primeiro
+            pool[key] = pool.pop(key)
+        self._scaled_sprites = []
         
-        return self._scaled_sprites[cache_key]
+        # Guarda no máximo algumas escalas anteriores
+        sizes = list(dict.fromkeys(key[0] for key in pool))
+        for key in [key for key in pool if key[0] in sizes[:-_MAX_POOLED_SCALES]]:
+            del pool[key]
     
     def _load_sprite(self, path):
         """Carrega um sprite individual"""
         try:
             if not os.path.exists(path):
-                print(f"Aviso: Sprite não encontrado em {path}")
-                return self._create_default_sprite()
+                logger.warning("Sprite não encontrado em %s", path)
+                return self._default_sprite
                 
             sprite = pygame.image.load(path)
-           
-            if sprite.get_size() != (self._base_sprite_size, self._base_sprite_size):
-                sprite = pygame.transform.scale(sprite, (self._base_sprite_size, self._base_sprite_size))
+            
+            # Todos os assets já vêm em 16x16: a checagem só existe em modo de
+            # desenvolvimento (python -O a remove)
+            assert sprite.get_size() == (self._base_sprite_size, self._base_sprite_size), \
+                f"Sprite {path} tem tamanho {sprite.get_size()}, esperado {self._base_sprite_size}px"
             return sprite
         except (pygame.error, FileNotFoundError) as e:
-            print(f"Erro ao carregar sprite {path}: {e}")
-            return self._create_default_sprite()
+            logger.error("Erro ao carregar sprite %s: %s", path, e)
+            return self._default_sprite
     
     def _create_default_sprite(self):
         """Cria um sprite padrão quando o original não é encontrado"""
@@ -55,6 +251,57 @@ class SpriteManager:
         sprite.fill((255, 0, 255))  # Magenta para indicar sprite faltando
         return sprite
     
+    def _create_blank_sprite(self):
+        """Cria um sprite totalmente transparente no tamanho atual"""
+        sprite = pygame.Surface((self._current_sprite_size, self._current_sprite_size), pygame.SRCALPHA)
+        return sprite.convert_alpha() if self._display_converted else sprite
+    
+    def _load_sprites_parallel(self, paths):
+        """
+        Carrega vários arquivos de sprite em paralelo.
+        
+        A leitura e a decodificação dos PNGs liberam o GIL dentro do pygame,
+        então threads sobrepõem o I/O dos arquivos.
+        
+        Returns:
+            dict: {caminho: sprite}
+        """
+        unique_paths = list(dict.fromkeys(paths))
+        workers = min(_MAX_LOAD_WORKERS, len(unique_paths)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique_paths, executor.map(self._load_sprite, unique_paths)))
+    
+    def _pack_into_atlas(self, sprites):
+        """
+        Copia os sprites carregados para uma única Surface (atlas) e os
+        substitui por subsurfaces dela.
+        
+        Todos os sprites passam a compartilhar um só buffer de pixels contíguo,
+        no mesmo formato, o que também permite converter tudo de uma vez.
+        
+        Args:
+            sprites: {chave: Surface} com sprites no tamanho base
+            
+        Returns:
+            dict: {chave: subsurface do atlas}
+        """
+        size = self._base_sprite_size
+        columns = _ATLAS_COLUMNS
+        rows = (len(sprites) + columns - 1) // columns
+        atlas = pygame.Surface((columns * size, max(rows, 1) * size), pygame.SRCALPHA)
+        
+        packed = {}
+        for index, (key, sprite) in enumerate(sprites.items()):
+            rect = pygame.Rect((index % columns) * size, (index // columns) * size, size, size)
+            # Atlas começa zerado (transparente): o máximo por canal copia os
+            # pixels exatamente, sem a mistura de alpha de um blit normal
+            # (area limita a cópia à célula, mesmo se um asset vier maior)
+            atlas.blit(sprite, rect, (0, 0, size, size), special_flags=pygame.BLEND_RGBA_MAX)
+            packed[key] = atlas.subsurface(rect)
+        
+        self._atlas = atlas
+        return packed
+    
     def _load_all_sprites(self):
         """Carrega todos os sprites do jogo"""
        
@@ -62,57 +309,73 @@ class SpriteManager:
         
         # Sprites do Pac-Man
         pacman_path = f"{assets_path}/pacman"
-        self._sprites['pacman'] = {
-            'closed': self._load_sprite(f"{pacman_path}/pac-fechado.png"),
-            'right': self._load_sprite(f"{pacman_path}/pac-dir.png"),
-            'right_open': self._load_sprite(f"{pacman_path}/pac-dir-ab.png"),
-            'left': self._load_sprite(f"{pacman_path}/pac-esq.png"),
-            'left_open': self._load_sprite(f"{pacman_path}/pac-esq-ab.png"),
-            'up': self._load_sprite(f"{pacman_path}/pac-cima.png"),
-            'up_open': self._load_sprite(f"{pacman_path}/pac-cima-ab.png"),
-            'down': self._load_sprite(f"{pacman_path}/pac-baixo.png"),
-            'down_closed': self._load_sprite(f"{pacman_path}/pac-baixo-fechado.png")
+        pacman_files = {
+            'closed': f"{pacman_path}/pac-fechado.png",
+            'right': f"{pacman_path}/pac-dir.png",
+            'right_open': f"{pacman_path}/pac-dir-ab.png",
+            'left': f"{pacman_path}/pac-esq.png",
+            'left_open': f"{pacman_path}/pac-esq-ab.png",
+            'up': f"{pacman_path}/pac-cima.png",
+            'up_open': f"{pacman_path}/pac-cima-ab.png",
+            'down': f"{pacman_path}/pac-baixo.png",
+            'down_closed': f"{pacman_path}/pac-baixo-fechado.png"
         }
         
-        # Sprites dos fantasmas
-        ghost_colors = ['red', 'pink', 'blue', 'yellow']
-        
-        for color in ghost_colors:
-            ghost_path = f"{assets_path}/ghosts/{color}"
-            self._sprites[f'ghost_{color}'] = {}
-            
-            # Carrega todos os sprites de direção para cada fantasma
-            for direction in ['up', 'down', 'left', 'right']:
-                for frame in ['1', '2']:
-                    direction_map = {
-                        'up': 'cima',
-                        'down': 'baixo', 
-                        'left': 'esq',
-                        'right': 'dir'
-                    }
-                    
-                    sprite_file = f"{ghost_path}/{color}-{direction_map[direction]}-{frame}.png"
-                    self._sprites[f'ghost_{color}'][f'{direction}_{frame}'] = self._load_sprite(sprite_file)
+        # Sprites dos fantasmas: todos os sprites de direção para cada cor
+        ghost_colors = _GHOST_COLORS
+        ghost_files = {
+            color: {
+                f'{direction}_{frame}': os.path.join(assets_path, "ghosts", color, f"{color}-{file_direction}-{frame}.png")
+                for direction, file_direction, frame in _GHOST_VARIANTS
+            }
+            for color in ghost_colors
+        }
         
         # Sprites de fantasmas vulneráveis
         vulnerable_path = f"{assets_path}/ghosts/vulnerable"
-        self._sprites['ghost_vulnerable'] = {
-            'blue_1': self._load_sprite(f"{vulnerable_path}/vulnerable-blue-1.png"),
-            'blue_2': self._load_sprite(f"{vulnerable_path}/vulnerable-blue-2.png"),
-            'white_1': self._load_sprite(f"{vulnerable_path}/vunerable-white-1.png"),
-            'white_2': self._load_sprite(f"{vulnerable_path}/vulnerable-white-2.png")
+        vulnerable_files = {
+            'blue_1': f"{vulnerable_path}/vulnerable-blue-1.png",
+            'blue_2': f"{vulnerable_path}/vulnerable-blue-2.png",
+            'white_1': f"{vulnerable_path}/vunerable-white-1.png",
+            'white_2': f"{vulnerable_path}/vulnerable-white-2.png"
         }
         
         # Sprite de fruta para power-up
-        self._sprites['fruit'] = self._load_sprite(f"{assets_path}/itens/fruit.png")
+        fruit_file = f"{assets_path}/itens/fruit.png"
+        
+        # Sprites de fantasma para a esquerda são o espelho exato dos da direita:
+        # com _MIRROR_GHOST_LEFT eles são gerados em vez de lidos do disco
+        mirrored = {}  # arquivo esquerdo -> arquivo direito
+        if _MIRROR_GHOST_LEFT:
+            for files in ghost_files.values():
+                for frame in (1, 2):
+                    mirrored[files[f'left_{frame}']] = files[f'right_{frame}']
+        
+        # Todos os arquivos são carregados de uma vez e depois distribuídos
+        all_files = [*pacman_files.values(), *vulnerable_files.values(), fruit_file]
+        for files in ghost_files.values():
+            all_files.extend(path for path in files.values() if path not in mirrored)
+        loaded = self._load_sprites_parallel(all_files)
+        for left_file, right_file in mirrored.items():
+            loaded[left_file] = pygame.transform.flip(loaded[right_file], True, False)
+        loaded = self._pack_into_atlas(loaded)
+        
+        sprites = self._sprites
+        for key, path in pacman_files.items():
+            sprites[SpriteId[f"PACMAN_{key.upper()}"]] = loaded[path]
+        for color, files in ghost_files.items():
+            for key, path in files.items():
+                sprites[SpriteId[f"GHOST_{color.upper()}_{key.upper()}"]] = loaded[path]
+        for key, path in vulnerable_files.items():
+            sprites[SpriteId[f"VULNERABLE_{key.upper()}"]] = loaded[path]
+        sprites[SpriteId.FRUIT] = loaded[fruit_file]
         
         # Sprites de pellets (criar proceduralmente)
-        self._sprites['pellet'] = {
-            'normal': self._create_pellet_sprite(2, (255, 255, 255)),
-            'power_up': self._create_power_up_sprite()
-        }
+        sprites[SpriteId.PELLET_NORMAL] = self._create_pellet_sprite(2, (255, 255, 255))
+        sprites[SpriteId.PELLET_POWER_UP] = self._create_power_up_sprite()
+        self._build_ghost_dispatch()
         
-        print(f"Sprites carregados: Pac-Man={len(self._sprites['pacman'])}, Fantasmas={len(ghost_colors)}")
+        logger.info("Sprites carregados: Pac-Man=%d, Fantasmas=%d", len(pacman_files), len(ghost_colors))
     
     def _create_pellet_sprite(self, radius, color):
         """Cria sprite de pellet proceduralmente"""
@@ -123,88 +386,42 @@ class SpriteManager:
     
     def _create_power_up_sprite(self):
         """Cria sprite de power-up usando o sprite de fruta"""
-        return self._sprites.get('fruit', self._create_default_sprite())
+        return self._sprites[SpriteId.FRUIT]
     
     def get_pacman_sprite(self, direction, animation_frame):
         """Retorna sprite do Pac-Man baseado na direção e frame de animação"""
         # Animação simples: alterna entre aberto e fechado
-        is_open = (animation_frame // 10) % 2 == 0
-        
-        sprite_key = None
-        if direction == Direction.RIGHT:
-            sprite_key = 'right_open' if is_open else 'right'
-            sprite = self._sprites['pacman'][sprite_key]
-        elif direction == Direction.LEFT:
-            sprite_key = 'left_open' if is_open else 'left'
-            sprite = self._sprites['pacman'][sprite_key]
-        elif direction == Direction.UP:
-            sprite_key = 'up_open' if is_open else 'up'
-            sprite = self._sprites['pacman'][sprite_key]
-        elif direction == Direction.DOWN:
-            sprite_key = 'down_closed' if not is_open else 'down'
-            sprite = self._sprites['pacman'][sprite_key]
-        else:
-            sprite_key = 'closed'
-            sprite = self._sprites['pacman'][sprite_key]
-            
-        return self._get_scaled_sprite(f"pacman_{sprite_key}", sprite)
+        is_open = _PACMAN_OPEN_LUT[animation_frame % 20]
+        
+        sprite_id = _PACMAN_BY_DIRECTION.get(direction, _PACMAN_STOPPED)[is_open]
+        return self._active_sprites[sprite_id]
     
     def get_ghost_sprite(self, ghost_type, direction, animation_frame, state="normal"):
         """Retorna sprite do fantasma baseado no tipo, direção, frame e estado"""
         if state == "vulnerable":
             # Animação de vulnerabilidade alternando entre azul e branco
-            timer = animation_frame // 15
-            if timer % 4 < 2:
-                sprite_key = 'blue_1' if timer % 2 == 0 else 'blue_2'
-                sprite = self._sprites['ghost_vulnerable'][sprite_key]
-            else:
-                sprite_key = 'white_1' if timer % 2 == 0 else 'white_2'
-                sprite = self._sprites['ghost_vulnerable'][sprite_key]
-            return self._get_scaled_sprite(f"ghost_vulnerable_{sprite_key}", sprite)
-        
-        # Mapear types para cores corretas
-        color_map = {
-            "red": "red",
-            "pink": "pink", 
-            "cyan": "blue",  # Cyan usa sprites azuis
-            "orange": "yellow"  # Orange usa sprites amarelos
-        }
-        
-        color = color_map.get(ghost_type, "red")
-        ghost_sprites = self._sprites.get(f'ghost_{color}', self._sprites['ghost_red'])
-        
-        # Escolhe direção
-        direction_map = {
-            Direction.UP: 'up',
-            Direction.DOWN: 'down',
-            Direction.LEFT: 'left',
-            Direction.RIGHT: 'right'
-        }
+            sprite_id = SpriteId.VULNERABLE_BLUE_1 + _VULNERABLE_LUT[animation_frame % 60]
+            return self._active_sprites[sprite_id]
         
-        dir_name = direction_map.get(direction, 'up')
-        
-        # Animação alternando entre frame 1 e 2
-        frame = '1' if (animation_frame // 20) % 2 == 0 else '2'
-        
-        sprite_key = f'{dir_name}_{frame}'
-        sprite = ghost_sprites.get(sprite_key, ghost_sprites.get('up_1', self._sprites['ghost_red']['up_1']))
-        
-        return self._get_scaled_sprite(f"ghost_{color}_{sprite_key}", sprite)
+        # Sprites da cor do tipo (padrão: vermelho), indexados por
+        # direção (padrão: cima) + frame da animação (1 ou 2)
+        ghost_sprites = self._ghost_dispatch.get(ghost_type)
+        if ghost_sprites is None:
+            ghost_sprites = self._ghost_dispatch["red"]
+        return ghost_sprites[_GHOST_DIRECTION_OFFSET.get(direction, 0)
+                             + _GHOST_FRAME_LUT[animation_frame % 40]]
     
     def get_pellet_sprite(self, pellet_type, animation_frame=0):
         """Retorna sprite do pellet"""
         if pellet_type == "power_up":
             # Power-up pisca
-            if (animation_frame // 15) % 2 == 0:
-                sprite = self._sprites['pellet']['power_up']
-                return self._get_scaled_sprite("pellet_power_up", sprite)
+            if _POWER_UP_VISIBLE_LUT[animation_frame % 30]:
+                return self._active_sprites[SpriteId.PELLET_POWER_UP]
             else:
                 # Retorna sprite transparente para efeito de piscar
-                transparent = pygame.Surface((self._current_sprite_size, self._current_sprite_size), pygame.SRCALPHA)
-                return transparent
+                return self._blank_sprite
         else:
-            sprite = self._sprites['pellet']['normal']
-            return self._get_scaled_sprite("pellet_normal", sprite)
+            return self._active_sprites[SpriteId.PELLET_NORMAL]
     
     @property
     def sprite_size(self):
@@ -221,5 +438,21 @@ class SpriteManager:
         """Retorna o fator de escala atual"""
         return self._scale_factor
 
-# Instância global do gerenciador de sprites
-sprite_manager = SpriteManager() 
\ No newline at end of file
+# Instância global do gerenciador de sprites, criada só no primeiro uso: importar
+# o módulo não dispara carregamento de arquivos nem inicialização do pygame
+_sprite_manager = None
+
+
+def get_sprite_manager() -> SpriteManager:
+    """Retorna a instância global do gerenciador de sprites, criando-a se preciso"""
+    global _sprite_manager
+    if _sprite_manager is None:
+        _sprite_manager = SpriteManager()
+    return _sprite_manager
+
+
+def __getattr__(name):
+    # Mantém "from ... import sprite_manager" funcionando (PEP 562)
+    if name == "sprite_manager":
+        return get_sprite_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
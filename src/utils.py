@@ -1,5 +1,10 @@
 from enum import Enum #Enum é uma classe que define um conjunto de constantes com nomes simbólicos
+import functools
+import heapq
 import math
+import weakref
+from array import array
+from typing import NamedTuple
 
 class Direction(Enum):
     UP = (0, -1)
@@ -18,38 +23,45 @@ class GameState(Enum):
     HISTORY = 6
     INTERMISSION = 7
 
-class Vector2D: #classe que representa um vetor 2D
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
+class RenderContext:
+    """
+    Parâmetros de desenho fixos durante um frame (escala e deslocamento na tela).
+    
+    Montado uma vez por frame pelo Game e repassado aos métodos draw, que
+    convertem a posição do mundo com uma única multiplicação e soma.
+    """
+    __slots__ = ('half_sprite', 'scale', 'offset_x', 'offset_y', 'sprite_size')
+
+    def __init__(self, half_sprite, scale, offset_x, offset_y, sprite_size):
+        self.half_sprite = half_sprite  # Metade do sprite base (centro -> canto)
+        self.scale = scale
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.sprite_size = sprite_size  # Tamanho do sprite já escalado
+
+class Vector2D(NamedTuple): #classe que representa um vetor 2D
+    """
+    Vetor 2D imutável.
+    
+    Como NamedTuple, os valores ficam guardados na própria tupla (sem __dict__)
+    e igualdade e hash vêm prontos, valendo também contra tuplas (x, y).
+    """
+    x: float
+    y: float
 
     def __add__(self, other):
         """Adiciona dois vetores ou um vetor e um tuple"""
-        if isinstance(other, Vector2D):
-            return Vector2D(self.x + other.x, self.y + other.y)
-        elif isinstance(other, tuple) and len(other) == 2:
-            return Vector2D(self.x + other[0], self.y + other[1])
-        raise TypeError("Operando inválido para adição")
+        return Vector2D(self.x + other[0], self.y + other[1])
 
     def __sub__(self, other):
         """Subtrai dois vetores ou um vetor e um tuple"""
-        if isinstance(other, Vector2D):
-            return Vector2D(self.x - other.x, self.y - other.y)
-        elif isinstance(other, tuple) and len(other) == 2:
-            return Vector2D(self.x - other[0], self.y - other[1])
-        raise TypeError("Operando inválido para subtração")
+        return Vector2D(self.x - other[0], self.y - other[1])
 
     def __mul__(self, scalar):
         """Multiplica um vetor por um escalar"""
         return Vector2D(self.x * scalar, self.y * scalar)
 
-    def __eq__(self, other):
-        """Verifica se dois vetores são iguais"""
-        if isinstance(other, Vector2D):
-            return self.x == other.x and self.y == other.y
-        elif isinstance(other, tuple) and len(other) == 2:
-            return self.x == other[0] and self.y == other[1]
-        return False
+    __rmul__ = __mul__  # Sem isso, escalar * vetor repetiria a tupla
 
     def __str__(self):
         """Retorna uma string representando o vetor"""
@@ -70,6 +82,17 @@ class Vector2D: #classe que representa um vetor 2D
         """Calcula a distância até outro vetor"""
         return (self - other).magnitude()
 
+    def distance_sq_to(self, other):
+        """
+        Calcula o quadrado da distância até outro vetor (sem sqrt)
+        
+        Para comparar com um limite, compare com o limite ao quadrado:
+        a.distance_sq_to(b) < r * r equivale a a.distance_to(b) < r.
+        """
+        dx = self.x - other[0]
+        dy = self.y - other[1]
+        return dx * dx + dy * dy
+
     def manhattan_distance_to(self, other):
         """
         Calcula a distância Manhattan até outro vetor
@@ -82,49 +105,288 @@ class Vector2D: #classe que representa um vetor 2D
         diagonal não é permitido.
         
         Args:
-            other: Vector2D de destino
+            other: Vector2D ou tupla (x, y) de destino
             
         Returns:
             float: Distância Manhattan entre os pontos
         """
-        if isinstance(other, Vector2D):
-            return abs(self.x - other.x) + abs(self.y - other.y)
-        elif isinstance(other, tuple) and len(other) == 2:
-            return abs(self.x - other[0]) + abs(self.y - other[1])
-        raise TypeError("Operando deve ser Vector2D ou tupla (x, y)")
+        return abs(self.x - other[0]) + abs(self.y - other[1])
 
     def to_tuple(self):
         """Converte o vetor para um tuple"""
         return (self.x, self.y)
 
     def copy(self):
-        """Retorna uma cópia do vetor"""
-        return Vector2D(self.x, self.y)
+        """Retorna uma cópia do vetor (imutável: a própria instância serve)"""
+        return self
+
+# Deslocamentos (dx, dy) em células dos vizinhos: UP, DOWN, LEFT, RIGHT
+_NEIGHBOR_OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# Heurísticas em unidades de célula, recebendo as coordenadas soltas
+def _h_manhattan(x1, y1, x2, y2):
+    return abs(x1 - x2) + abs(y1 - y2)
+
+def _h_euclidean(x1, y1, x2, y2):
+    return math.hypot(x1 - x2, y1 - y2)
 
-class AStarNode:
+def _h_chebyshev(x1, y1, x2, y2):
+    # Distância de Chebyshev (permite movimento diagonal)
+    return max(abs(x1 - x2), abs(y1 - y2))
+
+# Tipo de heurística -> função; tipos desconhecidos usam Manhattan
+_HEURISTICS = {
+    "manhattan": _h_manhattan,
+    "euclidean": _h_euclidean,
+    "diagonal": _h_chebyshev,
+}
+
+def _astar_kernel(width, start_index, goal_index, walkable, adjacency, heuristic):
     """
-    Nó para o algoritmo A* - representa uma posição no grid
+    Laço principal do A* sobre o grid, só com inteiros e listas planas.
+    
+    Cada célula é o inteiro iy * width + ix. walkable[célula] diz se ela
+    pode ser atravessada, adjacency[célula] lista seus vizinhos livres como
+    (vizinho, vx, vy) e heuristic(ix, iy, goal_ix, goal_iy) estima o custo
+    dela até o objetivo; cada passo entre células vizinhas custa 1.
+    
+    Returns:
+        array | None: Célula pai de cada célula (-1 no início do caminho), ou
+            None se o objetivo não é alcançável
     """
-    def __init__(self, position, g_cost=0, h_cost=0, parent=None):
-        self.position = position  # Vector2D
-        self.g_cost = g_cost     # Custo real do início até este nó
-        self.h_cost = h_cost     # Heurística (estimativa até o objetivo)
-        self.f_cost = g_cost + h_cost  # Custo total
-        self.parent = parent     # Nó pai (para reconstruir o caminho)
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    
+    # Estado da busca por célula: melhor custo conhecido e célula pai
+    size = len(walkable)
+    g_costs = [math.inf] * size
+    parents = array('i', [-1]) * size
+    # Células livres ainda não exploradas (1): a lista fechada e o teste de
+    # parede viram um único índice num bytearray, sem hash nem tupla
+    unexplored = bytearray(walkable)
+    unexplored[start_index] = 1  # O início conta mesmo se o fantasma raspa numa parede
     
-    def __lt__(self, other):
-        """Comparação para heap/priority queue"""
-        return self.f_cost < other.f_cost
+    g_costs[start_index] = 0
+    start_iy, start_ix = divmod(start_index, width)
+    goal_iy, goal_ix = divmod(goal_index, width)
+    # Heap de (f_cost, h_cost, célula), só inteiros: em empate de f sai
+    # primeiro quem está mais perto do objetivo (maior g), o que puxa a busca
+    # para ele em vez de abrir a frente inteira de custos iguais
+    start_h = heuristic(start_ix, start_iy, goal_ix, goal_iy)
+    open_list = [(start_h, start_h, start_index)]
     
-    def __eq__(self, other):
-        """Igualdade baseada na posição"""
-        return self.position == other.position
+    while open_list:
+        # Pega a célula com menor f_cost
+        _, _, current = heappop(open_list)
+        
+        # Se chegou à célula do objetivo
+        if current == goal_index:
+            return parents
+        
+        # Entrada velha: a célula foi empurrada de novo com custo melhor e já
+        # foi expandida por essa entrada; descarta sem reexaminar os vizinhos
+        if not unexplored[current]:
+            continue
+        
+        # Adiciona à lista fechada
+        unexplored[current] = 0
+        
+        g_cost = g_costs[current] + 1
+        
+        # Examina os vizinhos livres (bordas e paredes já filtradas)
+        for neighbor, nx, ny in adjacency[current]:
+            # Pula se já foi explorado
+            if not unexplored[neighbor]:
+                continue
+            
+            # Se encontrou um caminho melhor para este vizinho
+            if g_cost < g_costs[neighbor]:
+                g_costs[neighbor] = g_cost
+                parents[neighbor] = current
+                h_cost = heuristic(nx, ny, goal_ix, goal_iy)
+                heappush(open_list, (g_cost + h_cost, h_cost, neighbor))
+    
+    return None
+
+class _MapGraph:
+    """
+    Dados de busca derivados das paredes de um mapa, válidos para um layout.
+    
+    Um por mapa, compartilhado por todos os fantasmas (ver AStar._get_graph).
+    Células são indexadas por iy * width + ix.
+    """
+    __slots__ = ('version', 'width', 'height', 'cell_size', 'walkable', 'adjacency',
+                 '_landmarks', 'cached_path')
+
+    # Cantos do mapa (frações da largura e da altura) usados como landmarks
+    _LANDMARK_CORNERS = ((0, 0), (1, 0), (0, 1), (1, 1))
+
+    # Caminhos guardados por mapa; cada fantasma recalcula a cada poucos frames
+    _PATH_CACHE_SIZE = 4096
+
+    def __init__(self, version, width, height, cell_size, walkable):
+        self.version = version  # layout_version do mapa no momento da criação
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.walkable = walkable  # bytearray, 1 = célula livre para fantasmas
+        # Vizinhos livres de cada célula, ver _build_adjacency
+        self.adjacency = self._build_adjacency()
+        self._landmarks = None
+        # (início, objetivo, heurística) -> caminho. As paredes não mudam
+        # durante o layout, então o mesmo par de células sempre dá o mesmo
+        # caminho; o cache morre junto com o grafo quando o layout muda
+        self.cached_path = functools.lru_cache(maxsize=self._PATH_CACHE_SIZE)(self._find_path)
+
+    def _build_adjacency(self):
+        """
+        Monta, para cada célula, a tupla de vizinhos livres (vizinho, vx, vy).
+        
+        Bordas e paredes são resolvidas aqui, uma vez por layout: a busca só
+        percorre a tupla, sem teste de limite nem consulta ao bitmap.
+        """
+        width = self.width
+        height = self.height
+        walkable = self.walkable
+        adjacency = []
+        for iy in range(height):
+            for ix in range(width):
+                links = []
+                for dx, dy in _NEIGHBOR_OFFSETS:
+                    nx = ix + dx
+                    ny = iy + dy
+                    if 0 <= nx < width and 0 <= ny < height and walkable[ny * width + nx]:
+                        links.append((ny * width + nx, nx, ny))
+                adjacency.append(tuple(links))
+        return adjacency
+
+    def _find_path(self, start_index, goal_index, heuristic_type):
+        """
+        Busca A* entre duas células, sem cache (ver cached_path).
+        
+        Returns:
+            tuple: Vector2D dos centros das células (vazia se não houver caminho)
+        """
+        if heuristic_type == "alt":
+            heuristic = AStar._alt_heuristic(self, goal_index)
+        else:
+            heuristic = _HEURISTICS.get(heuristic_type, _h_manhattan)
+        parents = _astar_kernel(self.width, start_index, goal_index,
+                                self.walkable, self.adjacency, heuristic)
+        if parents is None:
+            return ()
+        return tuple(AStar.reconstruct_path(parents, goal_index, self.width, self.cell_size))
+
+    @property
+    def landmarks(self):
+        """
+        Distância real (em passos) de cada célula até cada landmark.
+        
+        Os landmarks são as células livres mais próximas dos cantos do mapa.
+        As tabelas são montadas por BFS na primeira busca que as usa; células
+        que um landmark não alcança ficam com distância 0.
+        """
+        if self._landmarks is None:
+            self._landmarks = [self._distances_from(cell) for cell in self._pick_landmarks()]
+        return self._landmarks
+
+    def _pick_landmarks(self):
+        """Retorna as células livres mais próximas de cada canto (sem repetir)"""
+        width = self.width
+        free = [cell for cell, is_free in enumerate(self.walkable) if is_free]
+        if not free:
+            return []
+        landmarks = {}
+        for fx, fy in self._LANDMARK_CORNERS:
+            corner_x = fx * (width - 1)
+            corner_y = fy * (self.height - 1)
+            cell = min(free, key=lambda c: abs(c % width - corner_x) + abs(c // width - corner_y))
+            landmarks[cell] = None
+        return list(landmarks)
+
+    def _distances_from(self, source):
+        """BFS a partir de source sobre as células livres"""
+        adjacency = self.adjacency
+        distances = array('i', [0]) * len(adjacency)
+        seen = bytearray(len(adjacency))
+        seen[source] = 1
+        frontier = [source]
+        distance = 0
+        
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for cell in frontier:
+                for neighbor, _, _ in adjacency[cell]:
+                    if not seen[neighbor]:
+                        seen[neighbor] = 1
+                        distances[neighbor] = distance
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distances
 
 class AStar:
     """
     Implementação do algoritmo A* para pathfinding em labirintos
     """
     
+    # Mapa -> _MapGraph do layout atual; a entrada some junto com o mapa
+    _graph_cache = weakref.WeakKeyDictionary()
+    
+    @staticmethod
+    def _get_graph(game_map):
+        """
+        Retorna os dados de busca do mapa (ver _MapGraph), refeitos quando o
+        layout muda.
+        
+        O bitmap de células livres é calculado uma vez por layout com a mesma
+        colisão do jogo (is_valid_xy no centro de cada célula), em vez de uma
+        chamada ao mapa por vizinho examinado.
+        """
+        version = game_map.layout_version
+        graph = AStar._graph_cache.get(game_map)
+        if graph is not None and graph.version == version:
+            return graph
+        
+        cell = game_map.cell_size
+        half = cell // 2
+        width = game_map.width
+        height = game_map.height
+        is_valid_xy = game_map.is_valid_xy
+        walkable = bytearray(
+            is_valid_xy(ix * cell + half, iy * cell + half, 16, "ghost")
+            for iy in range(height)
+            for ix in range(width)
+        )
+        graph = AStar._graph_cache[game_map] = _MapGraph(version, width, height, cell, walkable)
+        return graph
+    
+    @staticmethod
+    def _alt_heuristic(graph, goal_index):
+        """
+        Monta a heurística ALT (landmarks + desigualdade triangular) do objetivo.
+        
+        Para cada landmark L, |d(n, L) - d(objetivo, L)| nunca passa da
+        distância real de n ao objetivo; o maior desses limites, junto com a
+        Manhattan, é a estimativa. Ao contrário da Manhattan ela enxerga as
+        paredes do labirinto, e a busca abre menos células fora do caminho.
+        """
+        width = graph.width
+        bounds = [(table, table[goal_index]) for table in graph.landmarks]
+        
+        def heuristic(x, y, goal_x, goal_y):
+            cell = y * width + x
+            h = abs(x - goal_x) + abs(y - goal_y)
+            for table, goal_distance in bounds:
+                bound = table[cell] - goal_distance
+                if bound < 0:
+                    bound = -bound
+                if bound > h:
+                    h = bound
+            return h
+        
+        return heuristic
+    
     @staticmethod
     def heuristic(pos1, pos2, heuristic_type="manhattan"):
         """
@@ -133,16 +395,9 @@ class AStar:
         Args:
             pos1, pos2: Vector2D das posições
             heuristic_type: "manhattan", "euclidean", ou "diagonal"
+                ("alt" só existe dentro de find_path; aqui vira Manhattan)
         """
-        if heuristic_type == "manhattan":
-            return abs(pos1.x - pos2.x) + abs(pos1.y - pos2.y)
-        elif heuristic_type == "euclidean":
-            return pos1.distance_to(pos2)
-        elif heuristic_type == "diagonal":
-            # Distância de Chebyshev (permite movimento diagonal)
-            return max(abs(pos1.x - pos2.x), abs(pos1.y - pos2.y))
-        else:
-            return pos1.manhattan_distance_to(pos2)
+        return _HEURISTICS.get(heuristic_type, _h_manhattan)(pos1.x, pos1.y, pos2.x, pos2.y)
     
     @staticmethod
     def get_neighbors(position, cell_size=16):
@@ -153,108 +408,81 @@ class AStar:
             position: Vector2D da posição atual
             cell_size: Tamanho da célula do grid
         """
-        neighbors = []
-        directions = [(0, -cell_size), (0, cell_size), (-cell_size, 0), (cell_size, 0)]  # UP, DOWN, LEFT, RIGHT
-        
-        for dx, dy in directions:
-            neighbor_pos = Vector2D(position.x + dx, position.y + dy)
-            neighbors.append(neighbor_pos)
-        
-        return neighbors
+        return [Vector2D(position.x + dx * cell_size, position.y + dy * cell_size)
+                for dx, dy in _NEIGHBOR_OFFSETS]
     
     @staticmethod
     def find_path(start, goal, game_map, heuristic_type="manhattan"):
         """
         Encontra o caminho mais curto usando A*
         
+        A busca anda pelas células do grid do mapa: cada nó é o inteiro
+        iy * largura + ix, e custo, pai e estado ficam em listas planas
+        indexadas por ele, sem nenhum objeto por nó. O início é encaixado na
+        sua célula e o caminho só vira Vector2D no final.
+        
         Args:
             start: Vector2D posição inicial
             goal: Vector2D posição objetivo
             game_map: Instância do mapa para verificar colisões
-            heuristic_type: Tipo de heurística a usar
+            heuristic_type: Tipo de heurística a usar ("manhattan",
+                "euclidean", "diagonal" ou "alt", ver _alt_heuristic)
         
         Returns:
-            List[Vector2D]: Lista de posições do caminho (vazia se não houver caminho)
+            List[Vector2D]: Centros das células do caminho, do início ao objetivo
+                (vazia se não houver caminho)
         """
-        import heapq
-        
-        # Listas de nós
-        open_list = []  # Nós a serem explorados
-        closed_list = set()  # Nós já explorados
+        cell = game_map.cell_size
+        width = game_map.width
+        height = game_map.height
         
-        # Nó inicial
-        start_node = AStarNode(
-            position=start,
-            g_cost=0,
-            h_cost=AStar.heuristic(start, goal, heuristic_type)
-        )
+        # Posições do mundo -> células do grid; o objetivo é alcançado quando
+        # a busca chega à célula dele (comparação de inteiros)
+        start_ix, start_iy = int(start.x // cell), int(start.y // cell)
+        goal_ix, goal_iy = int(goal.x // cell), int(goal.y // cell)
+        if not (0 <= start_ix < width and 0 <= start_iy < height
+                and 0 <= goal_ix < width and 0 <= goal_iy < height):
+            return []
         
-        heapq.heappush(open_list, start_node)
+        # Objetivo fora do mapa ou numa parede nunca é alcançado: retorna logo
+        # em vez de explorar todo o labirinto para descobrir isso
+        graph = AStar._get_graph(game_map)
+        goal_index = goal_iy * width + goal_ix
+        if not graph.walkable[goal_index]:
+            return []
         
-        # Dicionário para rastrear melhor custo para cada posição
-        best_costs = {(start.x, start.y): 0}
-        
-        while open_list:
-            # Pega o nó com menor f_cost
-            current_node = heapq.heappop(open_list)
-            current_pos_key = (current_node.position.x, current_node.position.y)
-            
-            # Se chegou ao objetivo
-            if current_node.position.distance_to(goal) < 8:  # Tolerância de 8 pixels
-                return AStar.reconstruct_path(current_node)
-            
-            # Adiciona à lista fechada
-            closed_list.add(current_pos_key)
-            
-            # Examina vizinhos
-            for neighbor_pos in AStar.get_neighbors(current_node.position):
-                neighbor_key = (neighbor_pos.x, neighbor_pos.y)
-                
-                # Pula se já foi explorado
-                if neighbor_key in closed_list:
-                    continue
-                
-                # Pula se é parede
-                if not game_map.is_valid_position(neighbor_pos, 16, "ghost"):
-                    continue
-                
-                # Calcula custos
-                g_cost = current_node.g_cost + 16  # Custo de movimento (1 célula)
-                h_cost = AStar.heuristic(neighbor_pos, goal, heuristic_type)
-                
-                # Se encontrou um caminho melhor para este vizinho
-                if neighbor_key not in best_costs or g_cost < best_costs[neighbor_key]:
-                    best_costs[neighbor_key] = g_cost
-                    
-                    neighbor_node = AStarNode(
-                        position=neighbor_pos,
-                        g_cost=g_cost,
-                        h_cost=h_cost,
-                        parent=current_node
-                    )
-                    
-                    heapq.heappush(open_list, neighbor_node)
-        
-        # Não encontrou caminho
-        return []
+        # Caminhos entre as mesmas células vêm do cache do mapa; a cópia em
+        # lista protege o cache de quem alterar o caminho recebido
+        return list(graph.cached_path(start_iy * width + start_ix, goal_index, heuristic_type))
     
     @staticmethod
-    def reconstruct_path(node):
+    def reconstruct_path(parents, end_index, width, cell_size):
         """
-        Reconstrói o caminho a partir do nó final
+        Reconstrói o caminho a partir da célula final
         
         Args:
-            node: AStarNode final
+            parents: Célula pai de cada célula (-1 no início do caminho)
+            end_index: Célula final (iy * width + ix)
+            width: Largura do mapa em células
+            cell_size: Tamanho da célula do grid
         
         Returns:
-            List[Vector2D]: Caminho do início ao fim
+            List[Vector2D]: Centros das células, do início ao fim
         """
-        path = []
-        current = node
+        half = cell_size // 2
         
-        while current:
-            path.append(current.position.copy())
-            current = current.parent
+        # Primeira passada só conta as células, para preencher a lista de trás
+        # para frente sem append nem reverse
+        length = 0
+        current = end_index
+        while current != -1:
+            length += 1
+            current = parents[current]
         
-        path.reverse()  # Inverte para ter o caminho do início ao fim
-        return path 
\ No newline at end of file
+        path = [None] * length
+        current = end_index
+        for i in range(length - 1, -1, -1):
+            iy, ix = divmod(current, width)
+            path[i] = Vector2D(ix * cell_size + half, iy * cell_size + half)
+            current = parents[current]
+        return path